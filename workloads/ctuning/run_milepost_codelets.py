@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import os
 import re
+import selectors
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Callable
 
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -17,7 +25,25 @@ LIBC_SRC = LIBC_DIR / "src"
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
-
+# Content-addressed object cache shared across runs (see `_cached_object`).
+CACHE_DIR = Path(os.path.expanduser(os.environ.get("LINX_CACHE_DIR", "~/.cache/linx-isa")))
+
+# Shared by runtime and codelet compiles; `-target <triple>` is prepended per run.
+FREESTANDING_CFLAGS = [
+    "-O2",
+    "-ffreestanding",
+    "-fno-builtin",
+    "-fno-stack-protector",
+    "-fno-asynchronous-unwind-tables",
+    "-fno-unwind-tables",
+    "-fno-exceptions",
+    "-fno-jump-tables",
+    "-nostdlib",
+    f"-I{LIBC_INCLUDE}",
+]
+
+
+@functools.lru_cache(maxsize=None)
 def _check_exe(p: Path, what: str) -> None:
     if not p.exists():
         raise SystemExit(f"error: {what} not found: {p}")
@@ -31,6 +57,7 @@ def _run(cmd: list[str], *, verbose: bool, **kwargs) -> subprocess.CompletedProc
     return subprocess.run(cmd, check=False, **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
 def _default_clang() -> Path | None:
     env = os.environ.get("CLANG")
     if env:
@@ -39,6 +66,7 @@ def _default_clang() -> Path | None:
     return cand if cand.exists() else None
 
 
+@functools.lru_cache(maxsize=None)
 def _default_lld(clang: Path | None) -> Path | None:
     env = os.environ.get("LLD")
     if env:
@@ -50,6 +78,7 @@ def _default_lld(clang: Path | None) -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _default_qemu() -> Path | None:
     env = os.environ.get("QEMU")
     if env:
@@ -61,30 +90,169 @@ def _default_qemu() -> Path | None:
     return cand if cand.exists() else None
 
 
+@functools.lru_cache(maxsize=None)
 def _default_llvm_tool(clang: Path, tool: str) -> Path | None:
     cand = clang.parent / tool
     return cand if cand.exists() else None
 
 
+@dataclass(frozen=True)
+class Tools:
+    """Tool paths resolved and validated once in `main`; workers use them as-is."""
+
+    clang: Path
+    lld: Path
+    qemu: Path | None = None
+    llvm_objdump: Path | None = None
+    llvm_mc: Path | None = None
+
+
+_INSN_COUNT_TAG = b"LINX_INSN_COUNT="
+_DIGITS_RE = re.compile(rb"\d+")
+
+
 def _parse_linx_insn_count(stdout: bytes, stderr: bytes) -> int | None:
-    text = (stderr or b"") + b"\n" + (stdout or b"")
-    m = None
-    for mm in re.finditer(rb"LINX_INSN_COUNT=(\d+)", text):
-        m = mm
-    if not m:
-        return None
-    return int(m.group(1), 10)
+    # Last report wins, with stdout taking precedence over stderr. Scan backwards from the
+    # tail so large guest logs are not walked end to end.
+    for text in (stdout or b"", stderr or b""):
+        end = len(text)
+        while (idx := text.rfind(_INSN_COUNT_TAG, 0, end)) >= 0:
+            m = _DIGITS_RE.match(text, idx + len(_INSN_COUNT_TAG))
+            if m:
+                return int(m.group(0), 10)
+            end = idx
+    return None
+
+
+class _StreamTail:
+    """Incrementally scans one output stream, keeping only its tail and the last insn count."""
+
+    def __init__(self, limit: int = 4000) -> None:
+        self.limit = limit
+        self.tail = bytearray()
+        self.insn_count: int | None = None
+        self._partial = b""
+
+    def _scan(self, data: bytes) -> None:
+        count = _parse_linx_insn_count(data, b"")
+        if count is not None:
+            self.insn_count = count
+
+    def feed(self, chunk: bytes) -> None:
+        self.tail += chunk
+        del self.tail[: -self.limit]
+        data = self._partial + chunk
+        nl = data.rfind(b"\n")
+        if nl >= 0:
+            self._scan(data[: nl + 1])
+            data = data[nl + 1 :]
+        if len(data) > self.limit:
+            # Unterminated line: scan what we have and keep just enough to re-join a split tag.
+            self._scan(data)
+            data = data[-64:]
+        self._partial = data
+
+    def finish(self) -> None:
+        self._scan(self._partial)
+        self._partial = b""
+
+
+def _run_streaming(cmd: list[str], *, verbose: bool, timeout: float) -> tuple[int | None, _StreamTail, _StreamTail]:
+    """Run `cmd`, scanning stdout/stderr as they arrive. Returns `None` as the exit code on timeout."""
+    if verbose:
+        print("+", " ".join(cmd), file=sys.stderr)
+    out, err = _StreamTail(), _StreamTail()
+    deadline = time.monotonic() + timeout
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as p:
+        with selectors.DefaultSelector() as sel:
+            assert p.stdout is not None and p.stderr is not None
+            sel.register(p.stdout, selectors.EVENT_READ, out)
+            sel.register(p.stderr, selectors.EVENT_READ, err)
+            while sel.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    p.kill()
+                    p.wait()
+                    return None, out, err
+                for key, _ in sel.select(remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        key.data.feed(chunk)
+                    else:
+                        sel.unregister(key.fileobj)
+        try:
+            rc = p.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            p.kill()
+            p.wait()
+            return None, out, err
+    out.finish()
+    err.finish()
+    return rc, out, err
 
 
 def _collect_codelet_dirs(ctuning_root: Path) -> list[Path]:
-    dirs = sorted((ctuning_root / "program").glob("milepost-codelet-*"))
-    return [d for d in dirs if d.is_dir()]
+    # scandir entries carry the d_type, so no extra stat per candidate.
+    with os.scandir(ctuning_root / "program") as it:
+        dirs = [Path(e.path) for e in it if e.name.startswith("milepost-codelet-") and e.is_dir()]
+    return sorted(dirs, key=lambda p: p.name)
 
 
 def _find_sources(codelet_dir: Path) -> tuple[list[Path], list[Path]]:
-    wrappers = sorted(codelet_dir.glob("*.wrapper.c"))
-    codelets = sorted(p for p in codelet_dir.glob("*.c") if p not in wrappers)
-    return codelets, wrappers
+    codelets: list[Path] = []
+    wrappers: list[Path] = []
+    with os.scandir(codelet_dir) as it:
+        for e in it:
+            if not e.name.endswith(".c") or not e.is_file():
+                continue
+            (wrappers if e.name.endswith(".wrapper.c") else codelets).append(Path(e.path))
+    return sorted(codelets), sorted(wrappers)
+
+
+def _tool_id(tool: Path) -> str:
+    st = tool.stat()
+    return f"{tool.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _tree_digest(root: Path) -> str:
+    h = hashlib.sha256()
+    for p in sorted(root.rglob("*")):
+        if p.is_file():
+            h.update(str(p.relative_to(root)).encode())
+            h.update(b"\0")
+            h.update(p.read_bytes())
+    return h.hexdigest()
+
+
+def _cache_key(*parts: str | bytes) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part if isinstance(part, bytes) else part.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _cached_object(cache_dir: Path | None, key: str, obj: Path, build: Callable[[Path], None]) -> Path:
+    """Materialize `obj` from `cache_dir/<key>/`, calling `build(path)` on a miss."""
+    if cache_dir is None:
+        build(obj)
+        return obj
+    cached = cache_dir / key / obj.name
+    if not cached.exists():
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_name(f"{obj.name}.{os.getpid()}.tmp")
+        build(tmp)
+        os.replace(tmp, cached)
+    _link_or_copy(cached, obj)
+    return obj
 
 
 def _build_runtime(
@@ -92,81 +260,306 @@ def _build_runtime(
     target: str,
     out_dir: Path,
     *,
+    cache_dir: Path | None,
     verbose: bool,
 ) -> list[Path]:
     runtime_dir = out_dir / "_runtime"
     runtime_dir.mkdir(parents=True, exist_ok=True)
+    runtime_cache = cache_dir / "runtime" if cache_dir else None
+    clang_id = _tool_id(clang)
+    include_digest = _tree_digest(LIBC_INCLUDE)
 
     def cc(src: Path, obj_name: str, extra: list[str] | None = None) -> Path:
         obj = runtime_dir / obj_name
-        cflags = [
-            "-target",
-            target,
-            "-O2",
-            "-ffreestanding",
-            "-fno-builtin",
-            "-fno-stack-protector",
-            "-fno-asynchronous-unwind-tables",
-            "-fno-unwind-tables",
-            "-fno-exceptions",
-            "-fno-jump-tables",
-            "-nostdlib",
-            f"-I{LIBC_INCLUDE}",
-        ]
+        cflags = ["-target", target, *FREESTANDING_CFLAGS]
         if extra:
             cflags += extra
-        cmd = [str(clang), *cflags, "-c", str(src), "-o", str(obj)]
-        p = _run(cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        def build(dst: Path) -> None:
+            cmd = [str(clang), *cflags, "-c", str(src), "-o", str(dst)]
+            p = _run(cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if p.returncode != 0:
+                sys.stderr.buffer.write(p.stderr)
+                raise SystemExit(f"error: runtime compile failed: {src}")
+
+        key = _cache_key(src.read_bytes(), *cflags, clang_id, include_digest)
+        return _cached_object(runtime_cache, key, obj, build)
+
+    specs: list[tuple[Path, str, list[str] | None]] = [
+        (SCRIPT_DIR / "startup.c", "startup.o", None),
+        (SCRIPT_DIR / "astex_runtime.c", "astex_runtime.o", ["-Wno-unknown-pragmas"]),
+        (LIBC_SRC / "syscall.c", "syscall.o", None),
+        (LIBC_SRC / "stdio" / "stdio.c", "stdio.o", None),
+        (LIBC_SRC / "stdlib" / "stdlib.c", "stdlib.o", None),
+        (LIBC_SRC / "string" / "mem.c", "mem.o", None),
+        (LIBC_SRC / "string" / "str.c", "str.o", None),
+        (LIBC_SRC / "math" / "math.c", "math.o", None),
+        # Soft-fp is large and the backend bring-up occasionally misses patterns at -O2;
+        # keep it unoptimized like the existing qemu-tests runner.
+        (LIBC_SRC / "softfp" / "softfp.c", "softfp.o", ["-O0"]),
+    ]
+
+    # Each compile is its own clang process, so threads are enough; map() keeps link order stable.
+    with ThreadPoolExecutor(max_workers=min(len(specs), os.cpu_count() or 1)) as pool:
+        return list(pool.map(lambda spec: cc(*spec), specs))
+
+
+def _build_data_object(
+    tools: Tools,
+    target: str,
+    codelet_dir: Path,
+    out_dir: Path,
+    *,
+    cache_dir: Path | None,
+    verbose: bool,
+) -> Path:
+    data_path = codelet_dir / "codelet.data"
+    if not data_path.exists():
+        raise SystemExit(f"error: missing codelet.data: {data_path}")
+
+    asm = "\n".join(
+        [
+            ".section .rodata",
+            ".global __astex_codelet_data",
+            ".global __astex_codelet_data_end",
+            "__astex_codelet_data:",
+            f'  .incbin "{data_path}"',
+            "__astex_codelet_data_end:",
+            "",
+        ]
+    )
+    # Prefer llvm-mc fed on stdin: no clang driver startup and no temporary `.s` file.
+    def build(dst: Path) -> None:
+        if tools.llvm_mc:
+            cmd = [str(tools.llvm_mc), f"-triple={target}", "-filetype=obj", "-o", str(dst)]
+        else:
+            cmd = [str(tools.clang), "-target", target, "-x", "assembler", "-c", "-", "-o", str(dst)]
+        p = _run(cmd, verbose=verbose, input=asm.encode(), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         if p.returncode != 0:
             sys.stderr.buffer.write(p.stderr)
-            raise SystemExit(f"error: runtime compile failed: {src}")
-        return obj
+            raise SystemExit(f"error: failed to assemble codelet data: {data_path}")
+
+    assembler = tools.llvm_mc or tools.clang
+    key = _cache_key(hashlib.sha256(data_path.read_bytes()).hexdigest(), target, _tool_id(assembler))
+    data_cache = cache_dir / "data" if cache_dir else None
+    return _cached_object(data_cache, key, out_dir / "codelet_data.o", build)
+
+
+@dataclass(frozen=True)
+class CodeletResult:
+    name: str
+    status: str  # "ok", "fail", or "skip"
+    insn_count: int | None = None
+    # Progress lines, written by the parent in one go (empty when printed live under --verbose).
+    status_lines: tuple[str, ...] = ()
+
+
+def _objdump_codelet(llvm_objdump: Path, target: str, out_obj: Path, objdump_out: Path, *, verbose: bool) -> None:
+    # Rebuilds rewrite out_obj, so a disassembly at least as new is still current.
+    if objdump_out.exists() and objdump_out.stat().st_mtime_ns >= out_obj.stat().st_mtime_ns:
+        return
+    # Disassembly can run to megabytes; let objdump write straight into the file.
+    with objdump_out.open("wb") as fh:
+        p_od = _run(
+            [str(llvm_objdump), "-d", f"--triple={target}", str(out_obj)],
+            verbose=verbose,
+            stdout=fh,
+            stderr=subprocess.PIPE,
+        )
+    if p_od.returncode != 0:
+        objdump_out.unlink(missing_ok=True)
+        sys.stderr.buffer.write(p_od.stderr)
+        raise SystemExit(f"error: llvm-objdump failed: {out_obj.parent.name}")
 
-    startup = cc(SCRIPT_DIR / "startup.c", "startup.o")
-    astex = cc(SCRIPT_DIR / "astex_runtime.c", "astex_runtime.o", extra=["-Wno-unknown-pragmas"])
 
-    syscall = cc(LIBC_SRC / "syscall.c", "syscall.o")
-    stdio = cc(LIBC_SRC / "stdio" / "stdio.c", "stdio.o")
-    stdlib = cc(LIBC_SRC / "stdlib" / "stdlib.c", "stdlib.o")
-    mem = cc(LIBC_SRC / "string" / "mem.c", "mem.o")
-    string = cc(LIBC_SRC / "string" / "str.c", "str.o")
-    math = cc(LIBC_SRC / "math" / "math.c", "math.o")
+def _run_codelet(
+    name: str,
+    out_obj: Path,
+    *,
+    qemu: Path,
+    timeout: float,
+    insn_hist_plugin: Path | None,
+    insn_hist_out_dir: Path | None,
+    verbose: bool,
+) -> CodeletResult:
+    qemu_cmd = [
+        str(qemu),
+        "-machine",
+        "virt",
+        "-kernel",
+        str(out_obj),
+        "-nographic",
+        "-monitor",
+        "none",
+    ]
+    if insn_hist_plugin and insn_hist_out_dir:
+        hist_out = insn_hist_out_dir / f"{name}.dyn_insn_hist.json"
+        qemu_cmd += ["-plugin", f"{insn_hist_plugin},out={hist_out},top=200"]
+    rc, out, err = _run_streaming(qemu_cmd, verbose=verbose, timeout=timeout)
+    if rc is None or rc != 0:
+        if rc is None:
+            print(f"[fail] {name} (timeout {timeout:.1f}s)", file=sys.stderr)
+        else:
+            print(f"[fail] {name} (qemu exit={rc})", file=sys.stderr)
+        if out.tail:
+            sys.stderr.write("---- guest stdout (tail) ----\n")
+            sys.stderr.buffer.write(out.tail)
+            sys.stderr.write("\n")
+        if err.tail:
+            sys.stderr.write("---- qemu stderr (tail) ----\n")
+            sys.stderr.buffer.write(err.tail)
+            sys.stderr.write("\n")
+        return CodeletResult(name, "fail")
 
-    # Soft-fp is large and the backend bring-up occasionally misses patterns at -O2;
-    # keep it unoptimized like the existing qemu-tests runner.
-    softfp = cc(LIBC_SRC / "softfp" / "softfp.c", "softfp.o", extra=["-O0"])
+    insn_count = out.insn_count if out.insn_count is not None else err.insn_count
 
-    return [startup, astex, syscall, stdio, stdlib, mem, string, math, softfp]
+    return CodeletResult(name, "ok", insn_count)
 
 
-def _build_data_object(clang: Path, target: str, codelet_dir: Path, out_dir: Path, *, verbose: bool) -> Path:
-    data_path = codelet_dir / "codelet.data"
-    if not data_path.exists():
-        raise SystemExit(f"error: missing codelet.data: {data_path}")
+def _build_codelet(
+    d: Path,
+    out_dir: Path,
+    srcs: list[Path],
+    cflags: list[str],
+    *,
+    tools: Tools,
+    target: str,
+    runtime_objs: list[Path],
+    cache_dir: Path | None,
+    verbose: bool,
+) -> Path | None:
+    objs: list[Path] = []
+    # Embed codelet.data
+    objs.append(_build_data_object(tools, target, d, out_dir, cache_dir=cache_dir, verbose=verbose))
+
+    def compile_one(src: Path) -> Path:
+        obj = out_dir / (src.stem + ".o")
+        cmd = [str(tools.clang), *cflags, "-c", str(src), "-o", str(obj)]
+        p = _run(cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if p.returncode != 0:
+            sys.stderr.buffer.write(p.stderr)
+            raise SystemExit(f"error: compile failed: {src}")
+        return obj
 
-    asm = out_dir / "codelet_data.s"
-    asm.write_text(
-        "\n".join(
-            [
-                ".section .rodata",
-                ".global __astex_codelet_data",
-                ".global __astex_codelet_data_end",
-                "__astex_codelet_data:",
-                f'  .incbin "{data_path}"',
-                "__astex_codelet_data_end:",
-                "",
-            ]
-        )
-        + "\n"
-    )
+    # One driver invocation for all TUs; clang writes `<stem>.o` into cwd.
+    cmd = [str(tools.clang), *cflags, "-c", *[str(s) for s in srcs]]
+    p = _run(cmd, verbose=verbose, cwd=str(out_dir), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode == 0:
+        objs += [out_dir / (s.stem + ".o") for s in srcs]
+    else:
+        # Re-run per file so the failing source is named in the error.
+        for src in srcs:
+            objs.append(compile_one(src))
+        # Every TU compiled on its own, so the batch failed for another reason; don't hide it.
+        sys.stderr.write(f"warning: batched compile failed but per-file compiles succeeded: {d.name}\n")
+        sys.stderr.buffer.write(p.stderr)
 
-    obj = out_dir / "codelet_data.o"
-    cmd = [str(clang), "-target", target, "-c", str(asm), "-o", str(obj)]
-    p = _run(cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    out_obj = out_dir / "codelet.o"
+    link_cmd = [str(tools.lld), "-r", "-o", str(out_obj), *[str(o) for o in (runtime_objs + objs)]]
+    p = _run(link_cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     if p.returncode != 0:
         sys.stderr.buffer.write(p.stderr)
-        raise SystemExit(f"error: failed to assemble {asm}")
-    return obj
+        return None
+    return out_obj
+
+
+def _process_codelet(
+    d: Path,
+    *,
+    tools: Tools,
+    target: str,
+    base_cflags: list[str],
+    runtime_objs: list[Path],
+    build_id: str,
+    out_root: Path,
+    cache_dir: Path | None,
+    objdump_dir: Path | None,
+    do_run: bool,
+    timeout: float,
+    insn_hist_plugin: Path | None,
+    insn_hist_out_dir: Path | None,
+    verbose: bool,
+) -> CodeletResult:
+    codelets, wrappers = _find_sources(d)
+    if not wrappers or not codelets:
+        print(f"[skip] {d.name} (missing wrapper/codelet sources)", file=sys.stderr)
+        return CodeletResult(d.name, "skip")
+
+    status_lines: list[str] = []
+
+    def status(line: str) -> None:
+        if verbose:
+            print(line)
+        else:
+            status_lines.append(line)
+
+    out_dir = out_root / d.name
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    common_cflags = [
+        *base_cflags,
+        f"-I{d}",
+        "-include",
+        "math.h",
+        "-Wno-unknown-pragmas",
+        "-Wno-incompatible-pointer-types",
+    ]
+
+    # `.manifest` records the inputs of the last successful link; skip the rebuild if unchanged.
+    out_obj = out_dir / "codelet.o"
+    manifest = out_dir / ".manifest"
+    build_key = _cache_key(build_id, _tree_digest(d), *common_cflags)
+    if cache_dir and out_obj.exists() and manifest.exists() and manifest.read_text() == build_key:
+        status(f"[cache] {d.name}")
+    else:
+        manifest.unlink(missing_ok=True)
+        linked = _build_codelet(
+            d,
+            out_dir,
+            codelets + wrappers,
+            common_cflags,
+            tools=tools,
+            target=target,
+            runtime_objs=runtime_objs,
+            cache_dir=cache_dir,
+            verbose=verbose,
+        )
+        if linked is None:
+            print(f"[fail] {d.name} (link)", file=sys.stderr)
+            return CodeletResult(d.name, "fail", status_lines=tuple(status_lines))
+        manifest.write_text(build_key)
+        status(f"[ok] build {d.name}")
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # objdump only reads out_obj, so it overlaps with the QEMU run.
+        od_future = None
+        if objdump_dir:
+            assert tools.llvm_objdump is not None
+            objdump_out = objdump_dir / f"{d.name}.objdump.txt"
+            od_future = pool.submit(_objdump_codelet, tools.llvm_objdump, target, out_obj, objdump_out, verbose=verbose)
+
+        if do_run:
+            assert tools.qemu is not None
+            result = _run_codelet(
+                d.name,
+                out_obj,
+                qemu=tools.qemu,
+                timeout=timeout,
+                insn_hist_plugin=insn_hist_plugin,
+                insn_hist_out_dir=insn_hist_out_dir,
+                verbose=verbose,
+            )
+        else:
+            result = CodeletResult(d.name, "ok")
+
+    if od_future:
+        od_future.result()
+    if do_run and result.status == "ok":
+        if result.insn_count is not None:
+            status(f"[ok] run   {d.name} insns={result.insn_count}")
+        else:
+            status(f"[ok] run   {d.name} (no insn count)")
+    return replace(result, status_lines=tuple(status_lines))
 
 
 def main(argv: list[str]) -> int:
@@ -186,6 +579,12 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--compile-only", action="store_true", help="Only build; do not run QEMU.")
     parser.add_argument("--run", action="store_true", help="Run under QEMU after building.")
     parser.add_argument("--timeout", type=float, default=10.0)
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the object cache under $LINX_CACHE_DIR (default: ~/.cache/linx-isa).",
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="Parallel codelet workers (0 = CPU count).")
     parser.add_argument("--verbose", "-v", action="store_true")
     parser.add_argument(
         "--insn-counts-out",
@@ -209,17 +608,22 @@ def main(argv: list[str]) -> int:
     )
     args = parser.parse_args(argv)
 
-    ctuning_root = Path(os.path.expanduser(args.ctuning_root))
+    # Resolved up front: batched compiles run with cwd=<codelet out dir>.
+    ctuning_root = Path(os.path.expanduser(args.ctuning_root)).resolve()
     if not (ctuning_root / "program").exists():
         raise SystemExit(f"error: ctuning root does not look valid: {ctuning_root}")
 
     clang = Path(os.path.expanduser(args.clang)) if args.clang else (_default_clang() or None)
     if not clang:
         raise SystemExit("error: clang not found; set --clang or CLANG")
+    clang = clang.resolve()
     lld = Path(os.path.expanduser(args.lld)) if args.lld else (_default_lld(clang) or None)
     if not lld:
         raise SystemExit("error: ld.lld not found; set --lld or LLD")
+    lld = lld.resolve()
     qemu = Path(os.path.expanduser(args.qemu)) if args.qemu else (_default_qemu() or None)
+    if qemu:
+        qemu = qemu.resolve()
 
     _check_exe(clang, "clang")
     _check_exe(lld, "ld.lld")
@@ -240,24 +644,40 @@ def main(argv: list[str]) -> int:
     insn_hist_plugin: Path | None = None
     insn_hist_out_dir: Path | None = None
     if args.insn_hist_plugin:
-        insn_hist_plugin = Path(os.path.expanduser(args.insn_hist_plugin))
+        insn_hist_plugin = Path(os.path.expanduser(args.insn_hist_plugin)).resolve()
         _check_exe(insn_hist_plugin, "insn hist plugin")
         if not args.insn_hist_out_dir:
             raise SystemExit("error: --insn-hist-plugin requires --insn-hist-out-dir")
-        insn_hist_out_dir = Path(os.path.expanduser(args.insn_hist_out_dir))
+        insn_hist_out_dir = Path(os.path.expanduser(args.insn_hist_out_dir)).resolve()
         insn_hist_out_dir.mkdir(parents=True, exist_ok=True)
 
-    out_root = Path(os.path.expanduser(args.out_dir))
+    llvm_mc = _default_llvm_tool(clang, "llvm-mc")
+    if llvm_mc:
+        _check_exe(llvm_mc, "llvm-mc")
+    tools = Tools(
+        clang=clang,
+        lld=lld,
+        qemu=qemu if do_run else None,
+        llvm_objdump=llvm_objdump if args.objdump_dir else None,
+        llvm_mc=llvm_mc,
+    )
+
+    out_root = Path(os.path.expanduser(args.out_dir)).resolve()
     out_root.mkdir(parents=True, exist_ok=True)
 
     counts_path: Path | None = None
-    counts_fp = None
     if do_run:
         counts_path = Path(os.path.expanduser(args.insn_counts_out)) if args.insn_counts_out else (out_root / "insn_counts.csv")
-        counts_fp = counts_path.open("w", encoding="utf-8")
-        counts_fp.write("codelet,insn_count\n")
 
-    runtime_objs = _build_runtime(clang, args.target, out_root, verbose=args.verbose)
+    cache_dir = None if args.no_cache else CACHE_DIR
+    runtime_objs = _build_runtime(clang, args.target, out_root, cache_dir=cache_dir, verbose=args.verbose)
+    # Everything shared by all codelet builds; per-codelet manifests hash this with their own inputs.
+    build_id = _cache_key(
+        *(o.read_bytes() for o in runtime_objs),
+        _tree_digest(LIBC_INCLUDE),
+        _tool_id(clang),
+        _tool_id(lld),
+    )
 
     codelet_dirs = _collect_codelet_dirs(ctuning_root)
     if args.filter:
@@ -270,146 +690,56 @@ def main(argv: list[str]) -> int:
     if not codelet_dirs:
         raise SystemExit("error: no codelets selected")
 
-    passed = 0
-    failed = 0
-
-    for d in codelet_dirs:
-        codelets, wrappers = _find_sources(d)
-        if not wrappers or not codelets:
-            print(f"[skip] {d.name} (missing wrapper/codelet sources)", file=sys.stderr)
-            continue
-
-        out_dir = out_root / d.name
-        out_dir.mkdir(parents=True, exist_ok=True)
-
-        objs: list[Path] = []
-        # Embed codelet.data
-        objs.append(_build_data_object(clang, args.target, d, out_dir, verbose=args.verbose))
-
-        common_cflags = [
-            "-target",
-            args.target,
-            "-O2",
-            "-ffreestanding",
-            "-fno-builtin",
-            "-fno-stack-protector",
-            "-fno-asynchronous-unwind-tables",
-            "-fno-unwind-tables",
-            "-fno-exceptions",
-            "-fno-jump-tables",
-            "-nostdlib",
-            f"-I{LIBC_INCLUDE}",
-            f"-I{d}",
-            "-include",
-            "math.h",
-            "-Wno-unknown-pragmas",
-            "-Wno-incompatible-pointer-types",
-        ]
-
-        def compile_one(src: Path) -> Path:
-            obj = out_dir / (src.stem + ".o")
-            cmd = [str(clang), *common_cflags, "-c", str(src), "-o", str(obj)]
-            p = _run(cmd, verbose=args.verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if p.returncode != 0:
-                sys.stderr.buffer.write(p.stderr)
-                raise SystemExit(f"error: compile failed: {src}")
-            return obj
-
-        for src in codelets + wrappers:
-            objs.append(compile_one(src))
-
-        out_obj = out_dir / "codelet.o"
-        link_cmd = [str(lld), "-r", "-o", str(out_obj), *[str(o) for o in (runtime_objs + objs)]]
-        p = _run(link_cmd, verbose=args.verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if p.returncode != 0:
-            sys.stderr.buffer.write(p.stderr)
-            print(f"[fail] {d.name} (link)", file=sys.stderr)
-            failed += 1
-            continue
-
-        print(f"[ok] build {d.name}")
-
-        if args.objdump_dir:
-            assert llvm_objdump is not None
-            objdump_out = Path(os.path.expanduser(args.objdump_dir)) / f"{d.name}.objdump.txt"
-            p_od = _run(
-                [str(llvm_objdump), "-d", f"--triple={args.target}", str(out_obj)],
+    base_cflags = ["-target", args.target, *FREESTANDING_CFLAGS]
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    objdump_dir = Path(os.path.expanduser(args.objdump_dir)).resolve() if args.objdump_dir else None
+
+    results: dict[str, CodeletResult] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as ex:
+        futures = [
+            ex.submit(
+                _process_codelet,
+                d,
+                tools=tools,
+                target=args.target,
+                base_cflags=base_cflags,
+                runtime_objs=runtime_objs,
+                build_id=build_id,
+                out_root=out_root,
+                cache_dir=cache_dir,
+                objdump_dir=objdump_dir,
+                do_run=do_run,
+                timeout=args.timeout,
+                insn_hist_plugin=insn_hist_plugin,
+                insn_hist_out_dir=insn_hist_out_dir,
                 verbose=args.verbose,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
             )
-            if p_od.returncode != 0:
-                sys.stderr.buffer.write(p_od.stderr)
-                raise SystemExit(f"error: llvm-objdump failed: {d.name}")
-            objdump_out.write_bytes(p_od.stdout)
-
-        if not do_run:
-            passed += 1
-            continue
-
-        assert qemu is not None
-        qemu_cmd = [
-            str(qemu),
-            "-machine",
-            "virt",
-            "-kernel",
-            str(out_obj),
-            "-nographic",
-            "-monitor",
-            "none",
+            for d in codelet_dirs
         ]
-        if insn_hist_plugin and insn_hist_out_dir:
-            hist_out = insn_hist_out_dir / f"{d.name}.dyn_insn_hist.json"
-            qemu_cmd += ["-plugin", f"{insn_hist_plugin},out={hist_out},top=200"]
         try:
-            p = _run(
-                qemu_cmd,
-                verbose=args.verbose,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=args.timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            print(f"[fail] {d.name} (timeout {args.timeout:.1f}s)", file=sys.stderr)
-            if e.stdout:
-                sys.stderr.write("---- guest stdout (tail) ----\n")
-                sys.stderr.buffer.write(e.stdout[-4000:])
-                sys.stderr.write("\n")
-            if e.stderr:
-                sys.stderr.write("---- qemu stderr (tail) ----\n")
-                sys.stderr.buffer.write(e.stderr[-4000:])
-                sys.stderr.write("\n")
-            failed += 1
-            continue
-
-        if p.returncode != 0:
-            print(f"[fail] {d.name} (qemu exit={p.returncode})", file=sys.stderr)
-            if p.stdout:
-                sys.stderr.write("---- guest stdout (tail) ----\n")
-                sys.stderr.buffer.write(p.stdout[-4000:])
-                sys.stderr.write("\n")
-            if p.stderr:
-                sys.stderr.write("---- qemu stderr (tail) ----\n")
-                sys.stderr.buffer.write(p.stderr[-4000:])
-                sys.stderr.write("\n")
-            failed += 1
-            continue
-
-        insn_count = _parse_linx_insn_count(p.stdout or b"", p.stderr or b"")
-
-        if insn_count is not None:
-            print(f"[ok] run   {d.name} insns={insn_count}")
-        else:
-            print(f"[ok] run   {d.name} (no insn count)")
-
-        if counts_fp:
-            counts_fp.write(f"{d.name},{insn_count if insn_count is not None else ''}\n")
-
-        passed += 1
+            for fut in as_completed(futures):
+                r = fut.result()
+                results[r.name] = r
+                if r.status_lines:
+                    sys.stdout.write("".join(line + "\n" for line in r.status_lines))
+        except BaseException:
+            for fut in futures:
+                fut.cancel()
+            raise
+
+    passed = sum(1 for r in results.values() if r.status == "ok")
+    failed = sum(1 for r in results.values() if r.status == "fail")
 
     print(f"summary: passed={passed} failed={failed}")
-    if counts_fp:
-        counts_fp.close()
+    if counts_path:
+        # Rows follow codelet order regardless of worker completion order; one write at the end.
+        rows = ["codelet,insn_count"]
+        for d in codelet_dirs:
+            r = results.get(d.name)
+            if r is None or r.status != "ok":
+                continue
+            rows.append(f"{r.name},{r.insn_count if r.insn_count is not None else ''}")
+        counts_path.write_text("\n".join(rows) + "\n", encoding="utf-8")
         print(f"wrote: {counts_path}")
     return 0 if failed == 0 else 1
 
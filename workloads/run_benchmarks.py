@@ -5,8 +5,10 @@ from __future__ import annotations
 import argparse
 import os
 import shlex
+import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -41,7 +43,9 @@ def _resolve_cc(arg_cc: str | None) -> Path:
     raw = arg_cc or os.environ.get("CC")
     if not raw:
         raise SystemExit("error: compiler is required; set --cc or CC")
-    cc = Path(os.path.expanduser(raw))
+    raw = os.path.expanduser(raw)
+    # A bare name (`--cc clang`) is looked up on PATH like the shell would.
+    cc = Path(shutil.which(raw) or raw)
     _check_exe(cc, "cc")
     return cc
 
@@ -54,6 +58,15 @@ def _common_flags(*, target: str, sysroot: str | None, opt: str, extra_cflags: l
     return flags
 
 
+def _thin_lto_flags(cc: Path) -> list[str]:
+    # lld runs the ThinLTO backends on a thread pool, so per-TU codegen overlaps at link time.
+    # `-fuse-ld=lld` finds ld.lld in the driver's own bin dir first, then on PATH.
+    cc = Path(shutil.which(str(cc)) or cc)
+    if not (cc.parent / "ld.lld").exists() and not shutil.which("ld.lld"):
+        raise SystemExit(f"error: --thin-lto requires ld.lld next to the compiler or on PATH: {cc.parent}")
+    return ["-flto=thin", "-fuse-ld=lld", "-Wl,--thinlto-jobs=all"]
+
+
 def _build_coremark(
     *,
     cc: Path,
@@ -64,6 +77,7 @@ def _build_coremark(
     out_dir: Path,
     port: str,
     iterations: int,
+    thin_lto: bool,
     verbose: bool,
 ) -> Path:
     core_up = WORKLOADS_DIR / "coremark" / "upstream"
@@ -85,6 +99,8 @@ def _build_coremark(
     exe = core_out / "coremark.elf"
 
     flags = _common_flags(target=target, sysroot=sysroot, opt=opt, extra_cflags=extra_cflags)
+    if thin_lto:
+        flags += _thin_lto_flags(cc)
     cmd = [
         str(cc),
         *flags,
@@ -115,6 +131,7 @@ def _build_dhrystone(
     extra_cflags: list[str],
     out_dir: Path,
     runs: int,
+    thin_lto: bool,
     verbose: bool,
 ) -> Path:
     dhry = WORKLOADS_DIR / "dhrystone" / "upstream"
@@ -125,6 +142,8 @@ def _build_dhrystone(
     exe = out / "dhrystone.elf"
 
     flags = _common_flags(target=target, sysroot=sysroot, opt=opt, extra_cflags=extra_cflags)
+    if thin_lto:
+        flags += _thin_lto_flags(cc)
     cmd = [
         str(cc),
         *flags,
@@ -208,6 +227,11 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--coremark-port", choices=["posix", "simple"], default="posix")
     ap.add_argument("--coremark-iterations", type=int, default=1)
     ap.add_argument("--dhrystone-runs", type=int, default=1000)
+    ap.add_argument(
+        "--thin-lto",
+        action="store_true",
+        help="Build with -flto=thin and ld.lld (must sit next to --cc) so per-TU codegen runs in parallel.",
+    )
     ap.add_argument(
         "--run-command",
         default=None,
@@ -222,27 +246,35 @@ def main(argv: list[str]) -> int:
     out_dir = Path(os.path.expanduser(args.out_dir))
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    coremark_exe = _build_coremark(
-        cc=cc,
-        target=args.target,
-        sysroot=args.sysroot,
-        opt=args.opt,
-        extra_cflags=args.cflag,
-        out_dir=out_dir,
-        port=args.coremark_port,
-        iterations=args.coremark_iterations,
-        verbose=args.verbose,
-    )
-    dhrystone_exe = _build_dhrystone(
-        cc=cc,
-        target=args.target,
-        sysroot=args.sysroot,
-        opt=args.opt,
-        extra_cflags=args.cflag,
-        out_dir=out_dir,
-        runs=args.dhrystone_runs,
-        verbose=args.verbose,
-    )
+    # The two builds write to disjoint subdirectories, so they can run side by side.
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        coremark_future = ex.submit(
+            _build_coremark,
+            cc=cc,
+            target=args.target,
+            sysroot=args.sysroot,
+            opt=args.opt,
+            extra_cflags=args.cflag,
+            out_dir=out_dir,
+            port=args.coremark_port,
+            iterations=args.coremark_iterations,
+            thin_lto=args.thin_lto,
+            verbose=args.verbose,
+        )
+        dhrystone_future = ex.submit(
+            _build_dhrystone,
+            cc=cc,
+            target=args.target,
+            sysroot=args.sysroot,
+            opt=args.opt,
+            extra_cflags=args.cflag,
+            out_dir=out_dir,
+            runs=args.dhrystone_runs,
+            thin_lto=args.thin_lto,
+            verbose=args.verbose,
+        )
+        coremark_exe = coremark_future.result()
+        dhrystone_exe = dhrystone_future.result()
 
     logs_dir = out_dir / "logs"
     logs_dir.mkdir(parents=True, exist_ok=True)
@@ -5,16 +5,22 @@ from __future__ import annotations
 import argparse
 import os
 import shlex
-import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 BENCH_DIR = REPO_ROOT / "workloads"
 GENERATED_DIR = REPO_ROOT / "workloads" / "generated"
 
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from workloads import run_benchmarks, run_polybench  # noqa: E402
+from workloads.ctuning import run_milepost_codelets  # noqa: E402
+
 
 @dataclass(frozen=True)
 class StepResult:
@@ -23,10 +29,20 @@ class StepResult:
     return_code: int
 
 
-def _run(cmd: list[str], *, verbose: bool = False) -> subprocess.CompletedProcess[bytes]:
+def _run_step(main_fn: Callable[[list[str]], int], cmd: list[str], *, verbose: bool = False) -> int:
+    """Call a sibling runner's `main()` in-process; `cmd` is the equivalent CLI for logs and the report."""
     if verbose:
         print("+", " ".join(shlex.quote(c) for c in cmd), file=sys.stderr)
-    return subprocess.run(cmd, cwd=str(REPO_ROOT), check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        return main_fn(cmd[2:])
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
 
 
 def _resolve_cc(arg_cc: str | None) -> str:
@@ -67,11 +83,9 @@ def main(argv: list[str]) -> int:
     if args.verbose:
         run_bench_cmd.append("--verbose")
 
-    p = _run(run_bench_cmd, verbose=args.verbose)
-    sys.stdout.buffer.write(p.stdout)
-    sys.stderr.buffer.write(p.stderr)
-    results.append(StepResult(name="coremark+dhrystone", command=run_bench_cmd, return_code=p.returncode))
-    if p.returncode != 0:
+    rc = _run_step(run_benchmarks.main, run_bench_cmd, verbose=args.verbose)
+    results.append(StepResult(name="coremark+dhrystone", command=run_bench_cmd, return_code=rc))
+    if rc != 0:
         raise SystemExit("error: run_benchmarks.py failed")
 
     if args.polybench:
@@ -92,11 +106,9 @@ def main(argv: list[str]) -> int:
         if args.verbose:
             run_poly_cmd.append("--verbose")
 
-        p = _run(run_poly_cmd, verbose=args.verbose)
-        sys.stdout.buffer.write(p.stdout)
-        sys.stderr.buffer.write(p.stderr)
-        results.append(StepResult(name="polybench", command=run_poly_cmd, return_code=p.returncode))
-        if p.returncode != 0:
+        rc = _run_step(run_polybench.main, run_poly_cmd, verbose=args.verbose)
+        results.append(StepResult(name="polybench", command=run_poly_cmd, return_code=rc))
+        if rc != 0:
             raise SystemExit("error: run_polybench.py failed")
 
     if args.ctuning_limit > 0:
@@ -131,11 +143,9 @@ def main(argv: list[str]) -> int:
             if args.verbose:
                 ct_cmd.append("--verbose")
 
-            p = _run(ct_cmd, verbose=args.verbose)
-            sys.stdout.buffer.write(p.stdout)
-            sys.stderr.buffer.write(p.stderr)
-            results.append(StepResult(name="ctuning", command=ct_cmd, return_code=p.returncode))
-            if p.returncode != 0:
+            rc = _run_step(run_milepost_codelets.main, ct_cmd, verbose=args.verbose)
+            results.append(StepResult(name="ctuning", command=ct_cmd, return_code=rc))
+            if rc != 0:
                 raise SystemExit("error: ctuning runner failed")
 
     report = GENERATED_DIR / "portfolio_report.md"
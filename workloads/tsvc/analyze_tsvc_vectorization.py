@@ -3,18 +3,42 @@
 from __future__ import annotations
 
 import argparse
+import array
 import collections
+import functools
 import json
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-
-
-_RE_FUNC = re.compile(r"^\s*([0-9a-fA-F]+)\s+<([^>]+)>:\s*$")
-_RE_BSTART_MEM = re.compile(r"(?i)\bbstart\.(?:mseq|mpar)\b")
-_RE_BSTART_TILE = re.compile(r"(?i)\bbstart\.(?:vseq|vpar)\b")
-_RE_VEC_INSN = re.compile(r"(?i)\bv\.[a-z0-9_]+")
-_RE_BTEXT_TARGET = re.compile(r"(?i)\bb\.text\s+([A-Za-z0-9_.$]+)")
+from typing import Callable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib parser is the fallback
+    orjson = None
+
+
+_RE_FUNC = re.compile(rb"^[ \t]*([0-9a-fA-F]+)[ \t]+<([^>\n]+)>:[ \t]*$", re.MULTILINE)
+_RE_VEC_INSN = re.compile(rb"(?i)\bv\.[a-z0-9_]+")
+_RE_BTEXT_TARGET = re.compile(rb"(?i)\bb\.text\s+([A-Za-z0-9_.$]+)")
+# One pass for all header/body evidence. The `vec`/`btext` arms only consume their prefix so
+# no alternative can swallow text another arm would have matched.
+_RE_ASM_FEATURES = re.compile(
+    rb"(?i)(?P<mem>\bbstart\.(?:mseq|mpar)\b)"
+    rb"|(?P<tile>\bbstart\.(?:vseq|vpar)\b)"
+    rb"|(?P<vec>\bv\.(?=[a-z0-9_]))"
+    rb"|(?P<btext>\bb\.text(?=\s+[A-Za-z0-9_.$]))"
+)
+_ASM_MEM = 1
+_ASM_TILE = 2
+_ASM_VEC = 4
+_ASM_BTEXT = 8
+_ASM_ALL = _ASM_MEM | _ASM_TILE | _ASM_VEC | _ASM_BTEXT
+_ASM_FEATURE_BITS = {"mem": _ASM_MEM, "tile": _ASM_TILE, "vec": _ASM_VEC, "btext": _ASM_BTEXT}
 
 _GAP_BUCKET_ORDER = (
     "loop_removed_before_pass",
@@ -36,115 +60,195 @@ _GAP_BUCKET_ACTIONS: dict[str, str] = {
     "other": "manual_triage",
 }
 
+_LOOP_REMOVED_REASONS = frozenset({"no_loop_candidate", "no_tripcount_expr", "tripcount_expand_failed"})
+_INNER_CONTROL_FLOW_REASONS = frozenset(
+    {
+        "inner_control_flow",
+        "complex_control_flow",
+        "not_innermost_loop",
+        "not_loop_simplify",
+        "preheader_not_simple_branch",
+        "unsupported_inner_backedge",
+        "unsupported_branch_condition",
+        "unsupported_branch_predicate",
+        "unsupported_branch_fcmp_condition",
+        "unsupported_terminator",
+    }
+)
+_REDUCTION_REASONS = frozenset(
+    {
+        "value_live_out",
+        "unsupported_reduction_kind",
+        "unsupported_reduction_init",
+        "unsupported_reduction_value",
+    }
+)
+
+# Low-cardinality remark fields repeated on every row; interning shares one object per value.
+_INTERNED_REMARK_FIELDS = (
+    "function",
+    "status",
+    "reason",
+    "selected_mode",
+    "configured_mode",
+    "header_kind",
+    "tripcount_source",
+    "address_model",
+)
+
+# First matching rule wins; anything unmatched lands in "other".
+_BUCKET_RULES: tuple[tuple[Callable[[str], bool], str], ...] = (
+    (_LOOP_REMOVED_REASONS.__contains__, "loop_removed_before_pass"),
+    (lambda t: t.startswith("unsupported_value_expr:"), "unsupported_value_expression"),
+    (lambda t: "non_affine" in t or t == "unsupported_store_stride", "non_affine_address"),
+    (_INNER_CONTROL_FLOW_REASONS.__contains__, "inner_control_flow"),
+    (_REDUCTION_REASONS.__contains__, "reductions_live_out"),
+    ("no_store_in_loop".__eq__, "no_store_loops"),
+)
+
 
 def _read_kernel_list(path: Path) -> list[str]:
     kernels: list[str] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        name = raw.strip()
-        if not name or name.startswith("#"):
-            continue
-        kernels.append(name)
+    with path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            name = raw.strip()
+            if not name or name.startswith("#"):
+                continue
+            kernels.append(name)
     if not kernels:
         raise SystemExit(f"error: empty kernel list: {path}")
     return kernels
 
 
-def _split_functions(objdump_text: str) -> dict[str, str]:
-    functions: dict[str, list[str]] = {}
-    current: str | None = None
-    for line in objdump_text.splitlines():
-        m = _RE_FUNC.match(line)
-        if m:
-            name = m.group(2)
-            if not name.startswith("."):
-                current = name
-                functions[current] = [line]
-                continue
-        if current is not None:
-            functions[current].append(line)
-    return {name: "\n".join(lines).rstrip() + "\n" for name, lines in functions.items()}
-
-
-def _lookup_function_name(functions: dict[str, str], kernel: str) -> str | None:
-    if kernel in functions:
-        return kernel
-    prefixed = f"_{kernel}"
-    if prefixed in functions:
-        return prefixed
-    return None
+@dataclass(frozen=True)
+class FunctionTable:
+    """Function spans in the objdump buffer: `names[i]` covers `buf[starts[i]:ends[i]]`."""
+
+    names: list[str]
+    starts: array.array
+    ends: array.array
+    index: dict[str, int]
+
+    def span(self, name: str) -> tuple[int, int]:
+        i = self.index[name]
+        return self.starts[i], self.ends[i]
+
+
+def _map_objdump(path: Path) -> bytes | mmap.mmap:
+    # Every pattern matches ASCII tokens only, so scan the raw bytes and skip a full-file decode.
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_WILLNEED"):
+        # The header split reads the whole map front to back; start the page-in up front.
+        mm.madvise(mmap.MADV_WILLNEED)
+    return mm
+
+
+def _split_functions(buf: bytes | mmap.mmap) -> FunctionTable:
+    # Local labels (`<.L...>`) stay inside the enclosing function's body.
+    headers = [m for m in _RE_FUNC.finditer(buf) if not m.group(2).startswith(b".")]
+    table = FunctionTable(names=[], starts=array.array("Q"), ends=array.array("Q"), index={})
+    for m, nxt in zip(headers, headers[1:] + [None]):
+        start = m.start()
+        end = nxt.start() if nxt is not None else len(buf)
+        while end > start and buf[end - 1] in b" \t\n\r\x0b\x0c":
+            end -= 1
+        name = m.group(2).decode("utf-8", errors="replace")
+        if name in table.index:
+            # Same override semantics as a dict keyed by name: the later span wins in place.
+            i = table.index[name]
+            table.starts[i], table.ends[i] = start, end
+            continue
+        table.index[name] = len(table.names)
+        table.names.append(name)
+        table.starts.append(start)
+        table.ends.append(end)
+    return table
+
+
+def _build_symbol_index(functions: FunctionTable) -> dict[str, str]:
+    """Map kernel name -> symbol: an exact match wins over the `_`-prefixed spelling."""
+    index = {name[1:]: name for name in functions.names if name.startswith("_")}
+    index.update((name, name) for name in functions.names)
+    return index
+
+
+def _index_btext_targets(buf: bytes | mmap.mmap, functions: FunctionTable) -> dict[str, tuple[str, ...]]:
+    # Scan each span for `b.text` once; keep match order so the DFS below is unchanged.
+    known = functions.index
+    return {
+        name: tuple(
+            t for t in (m.group(1).decode("ascii") for m in _RE_BTEXT_TARGET.finditer(buf, start, end)) if t in known
+        )
+        for name, start, end in zip(functions.names, functions.starts, functions.ends)
+    }
 
 
-def _expand_btext_reachable(functions: dict[str, str], root: str) -> str:
+def _expand_btext_reachable(
+    functions: FunctionTable, btext_targets: dict[str, tuple[str, ...]], root: str
+) -> Iterator[tuple[int, int]]:
+    """Yield the spans reachable from `root` via `b.text`, root first, without joining them."""
     visited: set[str] = set()
     worklist: list[str] = [root]
-    chunks: list[str] = []
 
     while worklist:
         name = worklist.pop()
-        if name in visited:
-            continue
-        body = functions.get(name)
-        if body is None:
+        if name in visited or name not in functions.index:
             continue
         visited.add(name)
-        chunks.append(body)
-        for match in _RE_BTEXT_TARGET.finditer(body):
-            target = match.group(1)
-            if target not in visited and target in functions:
-                worklist.append(target)
+        yield functions.span(name)
+        worklist.extend(t for t in btext_targets[name] if t not in visited)
+
+
+def _scan_asm_features(buf: bytes | mmap.mmap, start: int, end: int) -> int:
+    found = 0
+    for m in _RE_ASM_FEATURES.finditer(buf, start, end):
+        found |= _ASM_FEATURE_BITS[m.lastgroup]
+        if found == _ASM_ALL:
+            break
+    return found
 
-    return "\n".join(chunks).rstrip() + "\n"
+
+def _loads_json_line(line: bytes) -> object:
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass  # let the lenient stdlib path decide (bad UTF-8, NaN, ...)
+    return json.loads(line.decode("utf-8", errors="replace"))
 
 
 def _parse_remarks_jsonl(path: Path | None) -> list[dict[str, object]]:
     if path is None or not path.exists():
         return []
     rows: list[dict[str, object]] = []
-    for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw.strip()
-        if not line:
-            continue
-        try:
-            payload = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if isinstance(payload, dict):
-            rows.append(payload)
+    with path.open("rb") as f:
+        for raw in f:
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                payload = _loads_json_line(line)
+            except ValueError:
+                continue
+            if isinstance(payload, dict):
+                for key in _INTERNED_REMARK_FIELDS:
+                    value = payload.get(key)
+                    if isinstance(value, str):
+                        payload[key] = sys.intern(value)
+                rows.append(payload)
     return rows
 
 
+@functools.lru_cache(maxsize=None)
 def _map_reason_to_gap_bucket(reason: str) -> str:
     text = reason.strip()
-    if not text:
-        return "other"
-    if text in {"no_loop_candidate", "no_tripcount_expr", "tripcount_expand_failed"}:
-        return "loop_removed_before_pass"
-    if text.startswith("unsupported_value_expr:"):
-        return "unsupported_value_expression"
-    if "non_affine" in text or text in {"unsupported_store_stride"}:
-        return "non_affine_address"
-    if text in {
-        "inner_control_flow",
-        "complex_control_flow",
-        "not_innermost_loop",
-        "not_loop_simplify",
-        "preheader_not_simple_branch",
-        "unsupported_inner_backedge",
-        "unsupported_branch_condition",
-        "unsupported_branch_predicate",
-        "unsupported_branch_fcmp_condition",
-        "unsupported_terminator",
-    }:
-        return "inner_control_flow"
-    if text in {
-        "value_live_out",
-        "unsupported_reduction_kind",
-        "unsupported_reduction_init",
-        "unsupported_reduction_value",
-    }:
-        return "reductions_live_out"
-    if text == "no_store_in_loop":
-        return "no_store_loops"
+    if text:
+        for matches, bucket in _BUCKET_RULES:
+            if matches(text):
+                return bucket
     return "other"
 
 
@@ -175,6 +279,225 @@ def _to_int(value: object, default: int = 0) -> int:
     return default
 
 
+def _write_json(path: Path, payload: object) -> None:
+    # Stream into the file instead of building the whole document as one string first.
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+@dataclass(frozen=True)
+class KernelRemarks:
+    fn_candidates: tuple[str, str]
+    loop_rows_total: int
+    lowered_loops: int
+    reject_loops: int
+    status: str
+    reason: str
+    selected_mode: str
+    configured_mode: str
+    # Typed copies of the chosen row's fields, coerced once here rather than per consumer.
+    touches_memory: bool | None = None
+    lane_count: int = 0
+    group_count: int = 0
+    force_scalar_lane: bool = False
+    has_recurrence: bool = False
+    header_kind: str = ""
+    tripcount_source: str = ""
+    address_model: str = ""
+
+    @property
+    def strict_candidate(self) -> bool:
+        return self.status == "lowered" and self.reason.startswith("lowered_vblock")
+
+
+def _merge_kernel_remarks(
+    kernel: str,
+    rows_per_function: collections.Counter[str],
+    rows_by_fn_status: dict[tuple[str, str], list[dict[str, object]]],
+    mode: str,
+) -> KernelRemarks:
+    fn_candidates = (kernel, f"_{kernel}")
+    loop_rows_total = sum(rows_per_function[fn] for fn in fn_candidates)
+    lowered_rows = [r for fn in fn_candidates for r in rows_by_fn_status.get((fn, "lowered"), ())]
+    reject_rows = [r for fn in fn_candidates for r in rows_by_fn_status.get((fn, "reject"), ())]
+
+    chosen = None
+    status = "reject"
+    reason = "no_remarks_for_kernel"
+    selected_mode = "mseq"
+    configured_mode = mode
+    if lowered_rows:
+        chosen = next(
+            (r for r in lowered_rows if str(r.get("reason", "")).startswith("lowered_vblock")),
+            lowered_rows[0],
+        )
+        status = "lowered"
+        reason = str(chosen.get("reason", "lowered_vblock"))
+        selected_mode = str(chosen.get("selected_mode", "mseq"))
+        configured_mode = str(chosen.get("configured_mode", mode))
+    elif reject_rows:
+        reason_counts: dict[str, int] = {}
+        for r in reject_rows:
+            key = str(r.get("reason", ""))
+            reason_counts[key] = reason_counts.get(key, 0) + 1
+        # max() keeps the first-seen reason on ties, matching Counter.most_common(1).
+        reason = max(reason_counts, key=reason_counts.__getitem__)
+        chosen = reject_rows[0]
+        selected_mode = str(chosen.get("selected_mode", "mseq"))
+        configured_mode = str(chosen.get("configured_mode", mode))
+
+    typed: dict[str, object] = {}
+    if chosen is not None:
+        typed = {
+            "touches_memory": _to_bool(chosen.get("touches_memory"), None),
+            "lane_count": _to_int(chosen.get("lane_count", 0)),
+            "group_count": _to_int(chosen.get("group_count", 0)),
+            "force_scalar_lane": bool(_to_bool(chosen.get("force_scalar_lane", False), False)),
+            "has_recurrence": bool(_to_bool(chosen.get("has_recurrence", False), False)),
+            "header_kind": str(chosen.get("header_kind", "")),
+            "tripcount_source": str(chosen.get("tripcount_source", "")),
+            "address_model": str(chosen.get("address_model", "")),
+        }
+    return KernelRemarks(
+        fn_candidates=fn_candidates,
+        loop_rows_total=loop_rows_total,
+        lowered_loops=len(lowered_rows),
+        reject_loops=len(reject_rows),
+        status=status,
+        reason=reason,
+        selected_mode=selected_mode,
+        configured_mode=configured_mode,
+        **typed,
+    )
+
+
+_WORKER_STATE: tuple[bytes | mmap.mmap, FunctionTable, dict[str, tuple[str, ...]], dict[str, str], int] | None = None
+_KERNEL_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def _open_dir(path: Path) -> int:
+    return os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+
+
+def _write_at(dir_fd: int, name: str, data: bytes) -> None:
+    # Open relative to the already-open output directory; one write per kernel in practice.
+    fd = os.open(name, _KERNEL_FILE_FLAGS, 0o666, dir_fd=dir_fd)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _init_kernel_worker(
+    objdump_path: Path,
+    functions: FunctionTable,
+    btext_targets: dict[str, tuple[str, ...]],
+    symbol_index: dict[str, str],
+    kernel_out_dir: Path,
+) -> None:
+    # Each worker maps the objdump itself; only the offset table crosses the process boundary.
+    global _WORKER_STATE
+    _WORKER_STATE = (_map_objdump(objdump_path), functions, btext_targets, symbol_index, _open_dir(kernel_out_dir))
+
+
+def _scan_kernel_asm(
+    kernel: str,
+    strict_candidate: bool,
+    buf: bytes | mmap.mmap,
+    functions: FunctionTable,
+    btext_targets: dict[str, tuple[str, ...]],
+    symbol_index: dict[str, str],
+    kernel_out_dir_fd: int,
+) -> dict[str, object]:
+    resolved = symbol_index.get(kernel)
+    if resolved is None:
+        return {
+            "kernel": kernel,
+            "resolved_symbol": None,
+            "has_mem_block": False,
+            "has_tile_block": False,
+            "has_vec_insn": False,
+            "has_btext": False,
+        }
+
+    # Headers and B.TEXT come from the root function; v.* may live anywhere reachable. Kernels
+    # whose remarks already rule out strict lowering only report root-level v.* evidence.
+    flags = _scan_asm_features(buf, *functions.span(resolved))
+    scan_reachable = strict_candidate and flags & _ASM_BTEXT
+    parts: list[bytes] = []
+    for i, (start, end) in enumerate(_expand_btext_reachable(functions, btext_targets, resolved)):
+        if i:
+            parts.append(b"\n")
+            if scan_reachable and not flags & _ASM_VEC and _RE_VEC_INSN.search(buf, start, end):
+                flags |= _ASM_VEC
+        parts.append(buf[start:end])
+        parts.append(b"\n")
+    _write_at(kernel_out_dir_fd, f"{kernel}.objdump.txt", b"".join(parts))
+    return {
+        "kernel": kernel,
+        "resolved_symbol": resolved,
+        "has_mem_block": bool(flags & _ASM_MEM),
+        "has_tile_block": bool(flags & _ASM_TILE),
+        "has_vec_insn": bool(flags & _ASM_VEC),
+        "has_btext": bool(flags & _ASM_BTEXT),
+    }
+
+
+def _scan_kernel_in_worker(kernel: str, strict_candidate: bool) -> dict[str, object]:
+    return _scan_kernel_asm(kernel, strict_candidate, *_WORKER_STATE)  # type: ignore[misc]
+
+
+def _iter_report_lines(
+    *,
+    mode: str,
+    objdump_path: Path,
+    total: int,
+    vec_count: int,
+    non_vec_count: int,
+    coverage: float,
+    missing_functions: list[str],
+    non_vectorized: list[str],
+    bucket_kernels: dict[str, list[str]],
+) -> Iterator[str]:
+    yield "# TSVC strict auto-vectorization coverage"
+    yield ""
+    yield f"- Mode: `{mode}`"
+    yield f"- Objdump: `{objdump_path}`"
+    yield f"- Kernels total: `{total}`"
+    yield f"- Strict vectorized kernels: `{vec_count}`"
+    yield f"- Strict non-vectorized kernels: `{non_vec_count}`"
+    yield f"- Coverage: `{coverage:.2f}%`"
+    yield ""
+    yield "## Strict metric"
+    yield "- Requires both remark-level lowering and decoupled body assembly evidence:"
+    yield "  - `reason` starts with `lowered_vblock`"
+    yield "  - root function has policy-matched header and `B.TEXT`:"
+    yield "    - `touches_memory=true` -> `BSTART.MSEQ`/`BSTART.MPAR`"
+    yield "    - `touches_memory=false` -> `BSTART.VSEQ`/`BSTART.VPAR`"
+    yield "  - `B.TEXT`-reachable body contains `v.*` operations"
+    if missing_functions:
+        yield ""
+        yield "## Missing kernel symbols"
+        for k in missing_functions[:64]:
+            yield f"- `{k}`"
+        if len(missing_functions) > 64:
+            yield f"- ... ({len(missing_functions) - 64} more)"
+    if non_vectorized:
+        yield ""
+        yield "## Non-vectorized kernels"
+        for k in non_vectorized[:128]:
+            yield f"- `{k}`"
+        if len(non_vectorized) > 128:
+            yield f"- ... ({len(non_vectorized) - 128} more)"
+    yield ""
+    yield "## Gap buckets"
+    for bucket in _GAP_BUCKET_ORDER:
+        yield f"- `{bucket}`: `{len(bucket_kernels[bucket])}`"
+
+
 def main(argv: list[str]) -> int:
     ap = argparse.ArgumentParser(description="Analyze TSVC auto-vectorization coverage (strict lowered-loop metric).")
     ap.add_argument("--objdump", required=True, help="Objdump text path")
@@ -187,6 +510,7 @@ def main(argv: list[str]) -> int:
     ap.add_argument("--gap-plan-out", required=True, help="Gap-plan JSON output path")
     ap.add_argument("--mode", default="auto", help="Mode label")
     ap.add_argument("--fail-under", type=int, default=None, help="Minimum strict-lowered kernels")
+    ap.add_argument("--jobs", "-j", type=int, default=0, help="Worker processes for the asm scan (default: CPU count)")
     args = ap.parse_args(argv)
 
     objdump_path = Path(args.objdump)
@@ -204,88 +528,70 @@ def main(argv: list[str]) -> int:
         raise SystemExit(f"error: kernel list not found: {kernel_list_path}")
 
     kernels = _read_kernel_list(kernel_list_path)
-    objdump_text = objdump_path.read_text(encoding="utf-8", errors="replace")
-    functions = _split_functions(objdump_text)
+    objdump = _map_objdump(objdump_path)
+    functions = _split_functions(objdump)
+    btext_targets = _index_btext_targets(objdump, functions)
+    symbol_index = _build_symbol_index(functions)
     kernel_out_dir.mkdir(parents=True, exist_ok=True)
 
-    asm_by_kernel: dict[str, dict[str, object]] = {}
-    missing_functions: list[str] = []
-
-    for kernel in kernels:
-        resolved = _lookup_function_name(functions, kernel)
-        if resolved is None:
-            missing_functions.append(kernel)
-            asm_by_kernel[kernel] = {
-                "kernel": kernel,
-                "resolved_symbol": None,
-                "has_mem_block": False,
-                "has_tile_block": False,
-                "has_vec_insn": False,
-                "has_btext": False,
-            }
-            continue
-
-        root_body = functions[resolved]
-        body = _expand_btext_reachable(functions, resolved)
-        (kernel_out_dir / f"{kernel}.objdump.txt").write_text(body, encoding="utf-8")
-        asm_by_kernel[kernel] = {
-            "kernel": kernel,
-            "resolved_symbol": resolved,
-            "has_mem_block": bool(_RE_BSTART_MEM.search(root_body)),
-            "has_tile_block": bool(_RE_BSTART_TILE.search(root_body)),
-            "has_vec_insn": bool(_RE_VEC_INSN.search(body)),
-            "has_btext": bool(_RE_BTEXT_TARGET.search(root_body)),
-        }
-
     rows = _parse_remarks_jsonl(remarks_jsonl_path)
-    by_function: dict[str, list[dict[str, object]]] = collections.defaultdict(list)
+    # Partition once by (function, status) so each kernel does O(1) lookups below.
+    rows_per_function: collections.Counter[str] = collections.Counter()
+    rows_by_fn_status: dict[tuple[str, str], list[dict[str, object]]] = collections.defaultdict(list)
     for row in rows:
         fn = str(row.get("function", "")).strip()
         if fn:
-            by_function[fn].append(row)
+            rows_per_function[fn] += 1
+            rows_by_fn_status[(fn, str(row.get("status", "")))].append(row)
+
+    # Remarks decide first: the reachable v.* scan only matters for strict candidates.
+    remarks_by_kernel = {
+        kernel: _merge_kernel_remarks(kernel, rows_per_function, rows_by_fn_status, args.mode) for kernel in kernels
+    }
+    strict_candidates = [remarks_by_kernel[kernel].strict_candidate for kernel in kernels]
+
+    asm_by_kernel: dict[str, dict[str, object]] = {}
+    missing_functions: list[str] = []
+
+    state = (functions, btext_targets, symbol_index)
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and len(kernels) > 1:
+        # initargs reach each worker once, so the tables are not re-pickled per kernel.
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_kernel_worker, initargs=(objdump_path, *state, kernel_out_dir)
+        ) as ex:
+            scanned = list(ex.map(_scan_kernel_in_worker, kernels, strict_candidates, chunksize=8))
+    else:
+        out_dir_fd = _open_dir(kernel_out_dir)
+        try:
+            scanned = [
+                _scan_kernel_asm(kernel, candidate, objdump, *state, out_dir_fd)
+                for kernel, candidate in zip(kernels, strict_candidates)
+            ]
+        finally:
+            os.close(out_dir_fd)
+
+    for row in scanned:
+        kernel = str(row["kernel"])
+        if row["resolved_symbol"] is None:
+            missing_functions.append(kernel)
+        asm_by_kernel[kernel] = row
 
     kernel_rows: list[dict[str, object]] = []
     vectorized: list[str] = []
     non_vectorized: list[str] = []
 
     for kernel in kernels:
-        fn_candidates = (kernel, f"_{kernel}")
-        linked_rows: list[dict[str, object]] = []
-        for fn in fn_candidates:
-            linked_rows.extend(by_function.get(fn, []))
-
-        lowered_rows = [r for r in linked_rows if str(r.get("status", "")) == "lowered"]
-        reject_rows = [r for r in linked_rows if str(r.get("status", "")) == "reject"]
-
-        chosen = None
-        status = "reject"
-        reason = "no_remarks_for_kernel"
-        selected_mode = "mseq"
-        configured_mode = args.mode
-        if lowered_rows:
-            chosen = next(
-                (r for r in lowered_rows if str(r.get("reason", "")).startswith("lowered_vblock")),
-                lowered_rows[0],
-            )
-            status = "lowered"
-            reason = str(chosen.get("reason", "lowered_vblock"))
-            selected_mode = str(chosen.get("selected_mode", "mseq"))
-            configured_mode = str(chosen.get("configured_mode", args.mode))
-        elif reject_rows:
-            reason_counts: collections.Counter[str] = collections.Counter(
-                str(r.get("reason", "")) for r in reject_rows
-            )
-            reason = reason_counts.most_common(1)[0][0] if reason_counts else "reject_unknown"
-            chosen = reject_rows[0]
-            selected_mode = str(chosen.get("selected_mode", "mseq"))
-            configured_mode = str(chosen.get("configured_mode", args.mode))
+        remarks = remarks_by_kernel[kernel]
+        status = remarks.status
+        reason = remarks.reason
 
         asm = asm_by_kernel[kernel]
         has_mem_block = bool(asm["has_mem_block"])
         has_tile_block = bool(asm["has_tile_block"])
         has_vec_insn = bool(asm["has_vec_insn"])
         has_btext = bool(asm["has_btext"])
-        touches_memory = _to_bool(chosen.get("touches_memory") if chosen else None, None)
+        touches_memory = remarks.touches_memory
         if touches_memory is True:
             has_expected_header = has_mem_block
             expected_header_kind = "mseq_or_mpar"
@@ -296,8 +602,7 @@ def main(argv: list[str]) -> int:
             has_expected_header = has_mem_block or has_tile_block
             expected_header_kind = "any_vector_header"
         has_any_header = has_mem_block or has_tile_block
-        has_strict_lowering_reason = status == "lowered" and reason.startswith("lowered_vblock")
-        strict_vectorized = has_strict_lowering_reason and has_expected_header and has_vec_insn and has_btext
+        strict_vectorized = remarks.strict_candidate and has_expected_header and has_vec_insn and has_btext
 
         if strict_vectorized:
             vectorized.append(kernel)
@@ -308,24 +613,24 @@ def main(argv: list[str]) -> int:
         kernel_rows.append(
             {
                 "kernel": kernel,
-                "function_candidates": list(fn_candidates),
+                "function_candidates": list(remarks.fn_candidates),
                 "resolved_symbol": asm["resolved_symbol"],
                 "status": status,
                 "reason": reason,
                 "bucket": bucket,
-                "configured_mode": configured_mode,
-                "selected_mode": selected_mode,
-                "lane_count": _to_int(chosen.get("lane_count", 0)) if chosen else 0,
-                "group_count": _to_int(chosen.get("group_count", 0)) if chosen else 0,
-                "force_scalar_lane": bool(_to_bool(chosen.get("force_scalar_lane", False), False)) if chosen else False,
-                "has_recurrence": bool(_to_bool(chosen.get("has_recurrence", False), False)) if chosen else False,
-                "header_kind": str(chosen.get("header_kind", "")) if chosen else "",
+                "configured_mode": remarks.configured_mode,
+                "selected_mode": remarks.selected_mode,
+                "lane_count": remarks.lane_count,
+                "group_count": remarks.group_count,
+                "force_scalar_lane": remarks.force_scalar_lane,
+                "has_recurrence": remarks.has_recurrence,
+                "header_kind": remarks.header_kind,
                 "touches_memory": touches_memory,
-                "tripcount_source": str(chosen.get("tripcount_source", "")) if chosen else "",
-                "address_model": str(chosen.get("address_model", "")) if chosen else "",
-                "loop_rows_total": len(linked_rows),
-                "lowered_loops": len(lowered_rows),
-                "reject_loops": len(reject_rows),
+                "tripcount_source": remarks.tripcount_source,
+                "address_model": remarks.address_model,
+                "loop_rows_total": remarks.loop_rows_total,
+                "lowered_loops": remarks.lowered_loops,
+                "reject_loops": remarks.reject_loops,
                 "asm_has_any_vector_header": has_any_header,
                 "asm_has_mem_header": has_mem_block,
                 "asm_has_tile_header": has_tile_block,
@@ -362,7 +667,7 @@ def main(argv: list[str]) -> int:
         "kernel_out_dir": str(kernel_out_dir),
     }
     json_out_path.parent.mkdir(parents=True, exist_ok=True)
-    json_out_path.write_text(json.dumps(coverage_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_json(json_out_path, coverage_payload)
 
     remarks_payload = {
         "mode": args.mode,
@@ -371,7 +676,7 @@ def main(argv: list[str]) -> int:
         "rows": kernel_rows,
     }
     remarks_summary_out_path.parent.mkdir(parents=True, exist_ok=True)
-    remarks_summary_out_path.write_text(json.dumps(remarks_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    _write_json(remarks_summary_out_path, remarks_payload)
 
     bucket_kernels: dict[str, list[str]] = {bucket: [] for bucket in _GAP_BUCKET_ORDER}
     kernel_plan: list[dict[str, object]] = []
@@ -392,9 +697,9 @@ def main(argv: list[str]) -> int:
                 "selected_mode": str(row.get("selected_mode", "mseq")),
                 "header_kind": str(row.get("header_kind", "")),
                 "touches_memory": row.get("touches_memory"),
-                "lane_count": _to_int(row.get("lane_count", 0)),
-                "group_count": _to_int(row.get("group_count", 0)),
-                "force_scalar_lane": bool(_to_bool(row.get("force_scalar_lane", False), False)),
+                "lane_count": row["lane_count"],
+                "group_count": row["group_count"],
+                "force_scalar_lane": row["force_scalar_lane"],
                 "loop_rows_total": int(row.get("loop_rows_total", 0)),
                 "next_action": _GAP_BUCKET_ACTIONS.get(bucket, "manual_triage"),
             }
@@ -411,46 +716,26 @@ def main(argv: list[str]) -> int:
         "kernel_plan": kernel_plan,
     }
     gap_plan_out_path.parent.mkdir(parents=True, exist_ok=True)
-    gap_plan_out_path.write_text(json.dumps(gap_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-
-    lines = [
-        "# TSVC strict auto-vectorization coverage",
-        "",
-        f"- Mode: `{args.mode}`",
-        f"- Objdump: `{objdump_path}`",
-        f"- Kernels total: `{total}`",
-        f"- Strict vectorized kernels: `{vec_count}`",
-        f"- Strict non-vectorized kernels: `{non_vec_count}`",
-        f"- Coverage: `{coverage:.2f}%`",
-        "",
-        "## Strict metric",
-        "- Requires both remark-level lowering and decoupled body assembly evidence:",
-        "  - `reason` starts with `lowered_vblock`",
-        "  - root function has policy-matched header and `B.TEXT`:",
-        "    - `touches_memory=true` -> `BSTART.MSEQ`/`BSTART.MPAR`",
-        "    - `touches_memory=false` -> `BSTART.VSEQ`/`BSTART.VPAR`",
-        "  - `B.TEXT`-reachable body contains `v.*` operations",
-    ]
-    if missing_functions:
-        lines.extend(["", "## Missing kernel symbols"] + [f"- `{k}`" for k in missing_functions[:64]])
-        if len(missing_functions) > 64:
-            lines.append(f"- ... ({len(missing_functions) - 64} more)")
-    if non_vectorized:
-        lines.extend(["", "## Non-vectorized kernels"] + [f"- `{k}`" for k in non_vectorized[:128]])
-        if len(non_vectorized) > 128:
-            lines.append(f"- ... ({len(non_vectorized) - 128} more)")
-    lines.extend(
-        [
-            "",
-            "## Gap buckets",
-            *[
-                f"- `{bucket}`: `{len(bucket_kernels[bucket])}`"
-                for bucket in _GAP_BUCKET_ORDER
-            ],
-        ]
-    )
+    _write_json(gap_plan_out_path, gap_payload)
+
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    report_path.write_text(
+        "\n".join(
+            _iter_report_lines(
+                mode=args.mode,
+                objdump_path=objdump_path,
+                total=total,
+                vec_count=vec_count,
+                non_vec_count=non_vec_count,
+                coverage=coverage,
+                missing_functions=missing_functions,
+                non_vectorized=non_vectorized,
+                bucket_kernels=bucket_kernels,
+            )
+        )
+        + "\n",
+        encoding="utf-8",
+    )
 
     if args.fail_under is not None and vec_count < args.fail_under:
         print(
@@ -4,37 +4,37 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
 import sys
 from pathlib import Path
 
-_RE_TSVC_ROW = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s+(\S+)\s+(\S+)\s*$")
-
 
 def _read_kernel_list(path: Path | None) -> list[str] | None:
     if path is None:
         return None
     kernels: list[str] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        name = raw.strip()
-        if not name or name.startswith("#"):
-            continue
-        kernels.append(name)
+    with path.open("r", encoding="utf-8") as f:
+        for raw in f:
+            name = raw.strip()
+            if not name or name.startswith("#"):
+                continue
+            kernels.append(name)
     return kernels
 
 
 def _parse_log(path: Path) -> dict[str, dict[str, str]]:
     rows: dict[str, dict[str, str]] = {}
-    for raw in path.read_text(encoding="utf-8", errors="replace").splitlines():
-        m = _RE_TSVC_ROW.match(raw)
-        if not m:
-            continue
-        kernel = m.group(1)
-        if kernel == "Loop":
-            continue
-        if kernel in rows:
-            continue
-        rows[kernel] = {"time": m.group(2), "checksum": m.group(3)}
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        for raw in f:
+            # Result rows are `<kernel> <time> <checksum>` with an ASCII identifier as the kernel.
+            parts = raw.split()
+            if len(parts) != 3:
+                continue
+            kernel, time, checksum = parts
+            if kernel == "Loop" or kernel in rows:
+                continue
+            if not (kernel.isascii() and kernel.isidentifier()):
+                continue
+            rows[kernel] = {"time": time, "checksum": checksum}
     return rows
 
 
@@ -71,20 +71,25 @@ def main(argv: list[str]) -> int:
     candidate_rows = _parse_log(candidate)
     kernel_filter = _read_kernel_list(kernel_list)
 
+    baseline_keys = baseline_rows.keys()
+    candidate_keys = candidate_rows.keys()
     if kernel_filter is None:
-        kernels = sorted(set(baseline_rows) | set(candidate_rows))
+        kernels = sorted(baseline_keys | candidate_keys)
+        # Every kernel comes from one of the logs, so the gaps are plain set differences.
+        missing_in_baseline = sorted(candidate_keys - baseline_keys)
+        missing_in_candidate = sorted(baseline_keys - candidate_keys)
     else:
         kernels = kernel_filter
+        missing_in_baseline = [k for k in kernels if k not in baseline_keys]
+        missing_in_candidate = [k for k in kernels if k not in candidate_keys]
 
-    missing_in_baseline = [k for k in kernels if k not in baseline_rows]
-    missing_in_candidate = [k for k in kernels if k not in candidate_rows]
-
+    common = baseline_keys & candidate_keys
     mismatches: list[dict[str, str]] = []
     for kernel in kernels:
-        b = baseline_rows.get(kernel)
-        c = candidate_rows.get(kernel)
-        if b is None or c is None:
+        if kernel not in common:
             continue
+        b = baseline_rows[kernel]
+        c = candidate_rows[kernel]
         if b["checksum"] != c["checksum"]:
             mismatches.append(
                 {
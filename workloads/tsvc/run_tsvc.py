@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import argparse
-import datetime
+import functools
+import hashlib
+import importlib
 import json
 import os
 import re
@@ -11,8 +13,18 @@ import shlex
 import shutil
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the stdlib parser is the fallback
+    orjson = None
 
 
 TSVC_DIR = Path(__file__).resolve().parent
@@ -30,7 +42,80 @@ COMPAT_RUNTIME_SRC = TSVC_DIR / "runtime" / "linx_compat.c"
 PINNED_TSVC_SRC = TSVC_DIR / "upstream" / "TSVC_2" / "src"
 FALLBACK_TSVC_SRC = WORKLOADS_DIR / "third_party" / "TSVC_2" / "src"
 
-_RE_TSVC_ROW = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s+(\S+)\s+(\S+)\s*$")
+# `[^\S\n]` is whitespace other than newline, so one row can never span two lines.
+_RE_TSVC_ROW = re.compile(rb"(?m)^[^\S\n]*([A-Za-z_][A-Za-z0-9_]*)[^\S\n]+(\S+)[^\S\n]+(\S+)[^\S\n]*$")
+_RE_KERNEL_CALL = re.compile(r"time_function\(&([A-Za-z_][A-Za-z0-9_]*)\s*,")
+# A whole `time_function(&name, ...)` call line; `[^\S\n]` keeps every part on one line.
+_RE_KERNEL_CALL_LINE = re.compile(
+    r"^[^\S\n]*time_function\(&([A-Za-z_][A-Za-z0-9_]*)[^\S\n]*,[^\n]*", re.MULTILINE
+)
+_RE_BRACE = re.compile(r"[{}]")
+_RE_SIZE_MACRO = re.compile(r"^\s*#define\s+(iterations|LEN_1D|LEN_2D)\s+\d+\s*$", re.MULTILINE)
+_RE_S176_BOUND = re.compile(r"4\s*\*\s*\(\s*iterations\s*/\s*LEN_1D\s*\)")
+_RE_TIME_FUNCTION = re.compile(
+    r"void\s+time_function\s*\(\s*test_function_t\s+vector_func\s*,\s*void\s*\*\s*arg_info\s*\)\s*\{.*?\n\}\n",
+    flags=re.DOTALL,
+)
+# These stay regexes rather than str.replace on the compact spellings: the (?![0-9fF]) guard
+# keeps 1.9f and longer literals such as 1.95 untouched, and each rule reports its own count.
+_S2111_RULES = (
+    (
+        "s2111_divide_cast_literal",
+        re.compile(r"/\s*\(\s*(?:float|double|real_t)\s*\)\s*1\.9(?![0-9fF])"),
+        "/1.9f",
+    ),
+    (
+        "s2111_divide_cast_literal_nested",
+        re.compile(
+            r"/\s*\(\s*\(\s*(?:float|double|real_t)\s*\)\s*1\.9\s*\)(?![0-9fF])"
+        ),
+        "/1.9f",
+    ),
+    (
+        "s2111_divide_parenthesized_literal",
+        re.compile(r"/\s*\(\s*1\.9\s*\)(?![0-9fF])"),
+        "/1.9f",
+    ),
+    (
+        "s2111_divide_literal",
+        re.compile(r"/\s*1\.9(?![0-9fF])"),
+        "/1.9f",
+    ),
+)
+# -pipe keeps clang's intermediate phases off disk; only the final -o object is written.
+_BASE_CFLAGS = (
+    "-O2",
+    "-pipe",
+    "-fsingle-precision-constant",
+    "-ffreestanding",
+    "-fno-builtin",
+    "-fno-stack-protector",
+    "-fno-asynchronous-unwind-tables",
+    "-fno-unwind-tables",
+    "-fno-exceptions",
+    "-fno-jump-tables",
+    "-nostdlib",
+    "-std=gnu11",
+)
+_MODE_COMPILE_FLAGS: dict[str, tuple[str, ...]] = {
+    "off": ("-fno-vectorize", "-fno-slp-vectorize", "-mllvm", "-linx-simt-autovec=0"),
+    **{
+        mode: (
+            "-fno-vectorize",
+            "-fno-slp-vectorize",
+            "-mllvm",
+            "-linx-simt-autovec=1",
+            "-mllvm",
+            f"-linx-simt-autovec-mode={autovec_mode}",
+        )
+        for mode, autovec_mode in (("mseq", "mseq"), ("mpar", "mpar-safe"), ("auto", "auto"))
+    },
+}
+_GATE_COVERAGE_SLOT = "<coverage-json>"
+_CACHE_LOCKS: dict[str, threading.Lock] = {}
+# The TSVC translation units and headers the build reads; nothing else in the source tree is staged.
+_TSVC_SOURCE_FILES = ("common.h", "tsvc.c", "common.c", "dummy.c", "array_defs.h")
+_PATCHED_STAGE_FILES = frozenset({"common.h", "common.c", "tsvc.c"})
 _VECTOR_MODES = ("off", "mseq", "mpar", "auto")
 _SOURCE_POLICIES = ("linx-v03-parity", "upstream")
 _CANONICAL_ITERATIONS = 32
@@ -53,7 +138,6 @@ class ModeArtifacts:
     gap_plan_json: Path
     vectorized_kernels: int
     total_kernels: int
-    checksums: dict[str, str] | None
 
 
 def _run(cmd: list[str], *, cwd: Path | None = None, verbose: bool = False, **kwargs) -> subprocess.CompletedProcess[bytes]:
@@ -62,6 +146,25 @@ def _run(cmd: list[str], *, cwd: Path | None = None, verbose: bool = False, **kw
     return subprocess.run(cmd, cwd=str(cwd) if cwd else None, check=False, **kwargs)
 
 
+def _load_json(path: Path) -> object:
+    data = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # let the lenient stdlib path decide (NaN, ...)
+    return json.loads(data)
+
+
+def _dump_json(payload: object) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers wider than 64 bits, which the stdlib encoder accepts
+    return (json.dumps(payload, indent=2, sort_keys=True) + "\n").encode("utf-8")
+
+
 def _check_exe(path: Path, what: str) -> None:
     if not path.exists():
         raise SystemExit(f"error: {what} not found: {path}")
@@ -69,6 +172,7 @@ def _check_exe(path: Path, what: str) -> None:
         raise SystemExit(f"error: {what} not executable: {path}")
 
 
+@functools.lru_cache(maxsize=None)
 def _git_head(path: Path) -> str | None:
     p = _run(
         ["git", "-C", str(path), "rev-parse", "HEAD"],
@@ -80,6 +184,7 @@ def _git_head(path: Path) -> str | None:
     return (p.stdout or b"").decode("utf-8", errors="replace").strip() or None
 
 
+@functools.lru_cache(maxsize=None)
 def _build_sha_manifest() -> dict[str, str | None]:
     roots = {
         "linx_isa": REPO_ROOT,
@@ -91,9 +196,14 @@ def _build_sha_manifest() -> dict[str, str | None]:
         "glibc": REPO_ROOT / "lib" / "glibc",
         "musl": REPO_ROOT / "lib" / "musl",
     }
-    return {name: _git_head(path) if path.exists() else None for name, path in roots.items()}
+    present = {name: path.resolve() for name, path in roots.items() if path.exists()}
+    # Each lookup is one short git process; run them side by side rather than back to back.
+    with ThreadPoolExecutor(max_workers=max(1, len(present))) as ex:
+        heads = dict(zip(present, ex.map(_git_head, present.values())))
+    return {name: heads.get(name) for name in roots}
 
 
+@functools.lru_cache(maxsize=None)
 def _classify_lane(path: Path | None) -> str:
     if path is None:
         return "none"
@@ -110,7 +220,12 @@ def _classify_lane(path: Path | None) -> str:
 
 
 def _default_clang() -> Path | None:
-    env = os.environ.get("CLANG")
+    return _default_clang_for(os.environ.get("CLANG"))
+
+
+# Keyed by the env value so a changed CLANG/QEMU is still honored within one process.
+@functools.lru_cache(maxsize=None)
+def _default_clang_for(env: str | None) -> Path | None:
     if env:
         return Path(os.path.expanduser(env))
     candidates = [
@@ -123,13 +238,18 @@ def _default_clang() -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def _default_llvm_tool(clang: Path, tool: str) -> Path | None:
     cand = clang.parent / tool
     return cand if cand.exists() else None
 
 
 def _default_qemu() -> Path | None:
-    env = os.environ.get("QEMU")
+    return _default_qemu_for(os.environ.get("QEMU"))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_qemu_for(env: str | None) -> Path | None:
     if env:
         return Path(os.path.expanduser(env))
     candidates = [
@@ -144,27 +264,26 @@ def _default_qemu() -> Path | None:
     return None
 
 
-def _rewrite_macro(text: str, macro: str, value: int) -> str:
-    pattern = rf"^\s*#define\s+{re.escape(macro)}\s+\d+\s*$"
-    repl = f"#define {macro} {value}"
-    out, n = re.subn(pattern, repl, text, flags=re.MULTILINE)
-    if n == 0:
-        raise SystemExit(f"error: failed to patch {macro} in TSVC common.h")
+def _rewrite_macros(text: str, values: dict[str, int]) -> str:
+    seen: set[str] = set()
+
+    def repl(m: re.Match[str]) -> str:
+        macro = m.group(1)
+        seen.add(macro)
+        return f"#define {macro} {values[macro]}"
+
+    out = _RE_SIZE_MACRO.sub(repl, text)
+    for macro in values:
+        if macro not in seen:
+            raise SystemExit(f"error: failed to patch {macro} in TSVC common.h")
     return out
 
 
 def _extract_kernel_names(tsvc_text: str) -> list[str]:
-    names = re.findall(r"time_function\(&([A-Za-z_][A-Za-z0-9_]*)\s*,", tsvc_text)
+    names = _RE_KERNEL_CALL.findall(tsvc_text)
     if not names:
         raise SystemExit("error: failed to extract TSVC kernel list")
-    seen: set[str] = set()
-    ordered: list[str] = []
-    for name in names:
-        if name in seen:
-            continue
-        seen.add(name)
-        ordered.append(name)
-    return ordered
+    return list(dict.fromkeys(names))
 
 
 def _find_function_span(c_text: str, func_name: str) -> tuple[int, int] | None:
@@ -175,14 +294,13 @@ def _find_function_span(c_text: str, func_name: str) -> tuple[int, int] | None:
     if brace < 0:
         return None
     depth = 0
-    for idx in range(brace, len(c_text)):
-        ch = c_text[idx]
-        if ch == "{":
+    for b in _RE_BRACE.finditer(c_text, brace):
+        if b.group() == "{":
             depth += 1
-        elif ch == "}":
+        else:
             depth -= 1
             if depth == 0:
-                return (m.start(), idx + 1)
+                return (m.start(), b.end())
     return None
 
 
@@ -192,33 +310,12 @@ def _canonicalize_s2111_divide_literals(tsvc_text: str) -> tuple[str, list[dict[
         raise SystemExit("error: failed to locate s2111 in staged TSVC source")
     begin, end = span
     fn_text = tsvc_text[begin:end]
+    # Every rule matches the literal 1.9, so a body without it has nothing to rewrite.
+    if "1.9" not in fn_text:
+        return tsvc_text, []
 
     canonicalizations: list[dict[str, object]] = []
-    rules = [
-        (
-            "s2111_divide_cast_literal",
-            re.compile(r"/\s*\(\s*(?:float|double|real_t)\s*\)\s*1\.9(?![0-9fF])"),
-            "/1.9f",
-        ),
-        (
-            "s2111_divide_cast_literal_nested",
-            re.compile(
-                r"/\s*\(\s*\(\s*(?:float|double|real_t)\s*\)\s*1\.9\s*\)(?![0-9fF])"
-            ),
-            "/1.9f",
-        ),
-        (
-            "s2111_divide_parenthesized_literal",
-            re.compile(r"/\s*\(\s*1\.9\s*\)(?![0-9fF])"),
-            "/1.9f",
-        ),
-        (
-            "s2111_divide_literal",
-            re.compile(r"/\s*1\.9(?![0-9fF])"),
-            "/1.9f",
-        ),
-    ]
-    for rule_name, pattern, repl in rules:
+    for rule_name, pattern, repl in _S2111_RULES:
         fn_text, count = pattern.subn(repl, fn_text)
         if count:
             canonicalizations.append(
@@ -262,13 +359,15 @@ def _stage_tsvc_sources(
 ) -> tuple[list[str], list[dict[str, object]]]:
     if stage_dir.exists():
         shutil.rmtree(stage_dir)
-    shutil.copytree(src_dir, stage_dir)
+    stage_dir.mkdir(parents=True)
+    # The patched files are read from src_dir and written once below instead of copied then rewritten.
+    for name in _TSVC_SOURCE_FILES:
+        if name not in _PATCHED_STAGE_FILES:
+            shutil.copyfile(src_dir / name, stage_dir / name)
 
     common_h = stage_dir / "common.h"
-    common_text = common_h.read_text(encoding="utf-8")
-    common_text = _rewrite_macro(common_text, "iterations", iterations)
-    common_text = _rewrite_macro(common_text, "LEN_1D", len_1d)
-    common_text = _rewrite_macro(common_text, "LEN_2D", len_2d)
+    common_text = (src_dir / "common.h").read_text(encoding="utf-8")
+    common_text = _rewrite_macros(common_text, {"iterations": iterations, "LEN_1D": len_1d, "LEN_2D": len_2d})
     if "tsvc_runtime_iterations" not in common_text:
         common_text += (
             "\n"
@@ -279,17 +378,17 @@ def _stage_tsvc_sources(
     common_h.write_text(common_text, encoding="utf-8")
 
     common_c = stage_dir / "common.c"
-    common_c_text = common_c.read_text(encoding="utf-8")
+    common_c_text = (src_dir / "common.c").read_text(encoding="utf-8")
     if "tsvc_runtime_iterations" not in common_c_text:
         common_c_text += (
             "\n"
             "__attribute__((noinline)) int tsvc_runtime_iterations(void) { return iterations; }\n"
             "__attribute__((noinline)) int tsvc_runtime_len_1d(void) { return LEN_1D; }\n"
         )
-        common_c.write_text(common_c_text, encoding="utf-8")
+    common_c.write_text(common_c_text, encoding="utf-8")
 
     tsvc_c = stage_dir / "tsvc.c"
-    tsvc_text = tsvc_c.read_text(encoding="utf-8")
+    tsvc_text = (src_dir / "tsvc.c").read_text(encoding="utf-8")
     source_canonicalizations: list[dict[str, object]] = []
 
     # Note: we intentionally do not carry a hardcoded "runtime guard" list here.
@@ -299,8 +398,7 @@ def _stage_tsvc_sources(
     # Keep TSVC kernels with 0-iteration bounds (e.g. s176 under the canonical
     # bring-up profile where iterations/LEN_1D == 0) from being folded away
     # before the Linx SIMT autovec pass runs.
-    s176_bound_pat = re.compile(r"4\s*\*\s*\(\s*iterations\s*/\s*LEN_1D\s*\)")
-    tsvc_text, n = s176_bound_pat.subn(
+    tsvc_text, n = _RE_S176_BOUND.subn(
         "4*(tsvc_runtime_iterations()/tsvc_runtime_len_1d())",
         tsvc_text,
     )
@@ -313,10 +411,6 @@ def _stage_tsvc_sources(
             "#include <sys/time.h>\n#include <stdint.h>\n",
         )
 
-    time_func_pat = re.compile(
-        r"void\s+time_function\s*\(\s*test_function_t\s+vector_func\s*,\s*void\s*\*\s*arg_info\s*\)\s*\{.*?\n\}\n",
-        flags=re.DOTALL,
-    )
     time_func_repl = (
         "void time_function(test_function_t vector_func, void * arg_info)\n"
         "{\n"
@@ -334,9 +428,14 @@ def _stage_tsvc_sources(
         "    printf(\"%llu\\t0x%08x\\n\", (unsigned long long)taken_us, bits.u);\n"
         "}\n"
     )
-    tsvc_text, n = time_func_pat.subn(lambda _m: time_func_repl, tsvc_text)
+    # No match can start before the `void` preceding the first `time_function`, so skip the
+    # kernel bodies ahead of it; the tail is still scanned to reject duplicate definitions.
+    first = tsvc_text.find("time_function")
+    m = _RE_TIME_FUNCTION.search(tsvc_text, max(tsvc_text.rfind("void", 0, first), 0)) if first >= 0 else None
+    n = 0 if m is None else 1 + len(_RE_TIME_FUNCTION.findall(tsvc_text, m.end()))
     if n != 1:
         raise SystemExit(f"error: expected to patch exactly 1 time_function, got {n}")
+    tsvc_text = tsvc_text[: m.start()] + time_func_repl + tsvc_text[m.end() :]
 
     if source_policy == "linx-v03-parity":
         tsvc_text, source_canonicalizations = _canonicalize_s2111_divide_literals(
@@ -355,49 +454,25 @@ def _stage_tsvc_sources(
         keep = {k for k in kernels if pattern.search(k)}
         if not keep:
             raise SystemExit(f"error: --kernel-regex matched 0 kernels: {kernel_regex}")
-        new_lines: list[str] = []
-        for line in tsvc_text.splitlines():
-            m = re.match(r"^\s*time_function\(&([A-Za-z_][A-Za-z0-9_]*)\s*,", line)
-            if m and m.group(1) not in keep:
-                new_lines.append(f"    // skipped by --kernel-regex: {line.strip()}")
-            else:
-                new_lines.append(line)
-        tsvc_text = "\n".join(new_lines) + "\n"
+        tsvc_text = _RE_KERNEL_CALL_LINE.sub(
+            lambda m: m.group(0) if m.group(1) in keep else f"    // skipped by --kernel-regex: {m.group(0).strip()}",
+            tsvc_text,
+        )
+        if not tsvc_text.endswith("\n"):
+            tsvc_text += "\n"
         kernels = [k for k in kernels if k in keep]
 
     tsvc_c.write_text(tsvc_text, encoding="utf-8")
     return kernels, source_canonicalizations
 
 
-def _mode_to_autovec(mode: str) -> str | None:
-    if mode == "off":
-        return None
-    if mode == "mseq":
-        return "mseq"
-    if mode == "mpar":
-        return "mpar-safe"
-    if mode == "auto":
-        return "auto"
-    raise SystemExit(f"error: unsupported vector mode: {mode}")
-
-
 def _mode_compile_flags(mode: str, remarks_jsonl: Path | None) -> list[str]:
-    flags: list[str] = ["-fno-vectorize", "-fno-slp-vectorize"]
-    autovec_mode = _mode_to_autovec(mode)
-    if autovec_mode is None:
-        flags.extend(["-mllvm", "-linx-simt-autovec=0"])
-    else:
-        flags.extend(
-            [
-                "-mllvm",
-                "-linx-simt-autovec=1",
-                "-mllvm",
-                f"-linx-simt-autovec-mode={autovec_mode}",
-            ]
-        )
-        if remarks_jsonl is not None:
-            flags.extend(["-mllvm", f"-linx-simt-autovec-remarks={remarks_jsonl}"])
-    return flags
+    base = _MODE_COMPILE_FLAGS.get(mode)
+    if base is None:
+        raise SystemExit(f"error: unsupported vector mode: {mode}")
+    if remarks_jsonl is not None and mode != "off":
+        return [*base, "-mllvm", f"-linx-simt-autovec-remarks={remarks_jsonl}"]
+    return list(base)
 
 
 def _compile_c(
@@ -415,17 +490,7 @@ def _compile_c(
         str(clang),
         "-target",
         target,
-        "-O2",
-        "-fsingle-precision-constant",
-        "-ffreestanding",
-        "-fno-builtin",
-        "-fno-stack-protector",
-        "-fno-asynchronous-unwind-tables",
-        "-fno-unwind-tables",
-        "-fno-exceptions",
-        "-fno-jump-tables",
-        "-nostdlib",
-        "-std=gnu11",
+        *_BASE_CFLAGS,
         *[f"-I{p}" for p in include_dirs],
         *extra_cflags,
         "-c",
@@ -440,18 +505,113 @@ def _compile_c(
         raise SystemExit(f"error: compile failed: {src}")
 
 
+def _hash_file(h: hashlib.blake2b, path: Path) -> None:
+    # Fixed-size chunks keep cache keys over large objects from holding whole files in memory.
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+
+
+def _header_digest(include_dirs: list[Path]) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    for root in include_dirs:
+        for header in sorted(root.rglob("*.h")):
+            h.update(str(header.relative_to(root)).encode())
+            h.update(b"\0")
+            _hash_file(h, header)
+    return h.hexdigest()
+
+
+def _obj_cache_key(*, clang: Path, target: str, src: Path, cflags: list[str], header_digest: str) -> str:
+    st = clang.stat()
+    h = hashlib.blake2b(digest_size=20)
+    for part in (str(clang.resolve()), str(st.st_size), str(st.st_mtime_ns), target, *_BASE_CFLAGS, *cflags, header_digest):
+        h.update(part.encode())
+        h.update(b"\0")
+    _hash_file(h, src)
+    return h.hexdigest()
+
+
+def _compile_c_cached(
+    *,
+    cache_dir: Path | None,
+    header_digest: str,
+    clang: Path,
+    target: str,
+    src: Path,
+    out_obj: Path,
+    include_dirs: list[Path],
+    extra_cflags: list[str],
+    verbose: bool,
+) -> None:
+    """`_compile_c`, served from `cache_dir/<key>.o` when the inputs are unchanged."""
+    compile_kwargs = dict(clang=clang, target=target, src=src, include_dirs=include_dirs, verbose=verbose)
+    # The stamp records which cache entry out_obj was copied from, so warm reruns skip the copy.
+    stamp = out_obj.with_name(out_obj.name + ".key")
+    if cache_dir is None:
+        stamp.unlink(missing_ok=True)
+        _compile_c(out_obj=out_obj, extra_cflags=extra_cflags, **compile_kwargs)
+        return
+    cflags = [*[f"-I{p}" for p in include_dirs], *extra_cflags]
+    key = _obj_cache_key(clang=clang, target=target, src=src, cflags=cflags, header_digest=header_digest)
+    if out_obj.exists() and stamp.exists() and stamp.read_text(encoding="utf-8") == key:
+        return
+    cached = cache_dir / f"{key}.o"
+    # Concurrent modes ask for the same common.c/dummy.c objects; only the first one compiles.
+    with _CACHE_LOCKS.setdefault(key, threading.Lock()):
+        if not cached.exists():
+            tmp = cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.o"
+            _compile_c(out_obj=tmp, extra_cflags=extra_cflags, **compile_kwargs)
+            os.replace(tmp, cached)
+    out_obj.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(cached, out_obj)
+    stamp.write_text(key, encoding="utf-8")
+
+
+def _elf_cache_key(
+    *,
+    clang: Path,
+    lld: Path,
+    target: str,
+    mode: str,
+    stage_dir: Path,
+    include_dirs: list[Path],
+    header_digest: str,
+    link_objs: list[Path],
+) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    parts = [mode, target, *_BASE_CFLAGS, *[f"-I{p}" for p in include_dirs], *_mode_compile_flags(mode, None)]
+    for tool in (clang, lld):
+        st = tool.stat()
+        parts += [str(tool.resolve()), str(st.st_size), str(st.st_mtime_ns)]
+    for part in (*parts, header_digest):
+        h.update(part.encode())
+        h.update(b"\0")
+    for path in (*(stage_dir / name for name in ("tsvc.c", "common.c", "dummy.c")), *link_objs):
+        _hash_file(h, path)
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _store_in_cache(src: Path, cached: Path) -> None:
+    tmp = cached.with_name(f"{cached.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    shutil.copyfile(src, tmp)
+    os.replace(tmp, cached)
+
+
 def _build_runtime_objects(
     *,
     clang: Path,
     target: str,
     out_dir: Path,
+    cache_dir: Path | None,
     verbose: bool,
 ) -> list[Path]:
     include_dirs = [COMPAT_INCLUDE, FREESTANDING_INCLUDE, TSVC_DIR]
     rt_dir = out_dir / "_runtime"
     rt_dir.mkdir(parents=True, exist_ok=True)
+    header_digest = _header_digest(include_dirs) if cache_dir is not None else ""
 
-    objs: list[Path] = []
     runtime_sources = [
         (STARTUP_SRC, "startup.o", []),
         (FREESTANDING_SRC / "syscall.c", "syscall.o", []),
@@ -464,11 +624,16 @@ def _build_runtime_objects(
         (FREESTANDING_SRC / "atomic" / "atomic_builtins.c", "atomic_builtins.o", []),
         (COMPAT_RUNTIME_SRC, "linx_compat.o", []),
     ]
-    for src, obj_name, extra in runtime_sources:
+    for src, _obj_name, _extra in runtime_sources:
         if not src.exists():
             raise SystemExit(f"error: missing runtime source: {src}")
+
+    def build(entry: tuple[Path, str, list[str]]) -> Path:
+        src, obj_name, extra = entry
         obj = rt_dir / obj_name
-        _compile_c(
+        _compile_c_cached(
+            cache_dir=cache_dir,
+            header_digest=header_digest,
             clang=clang,
             target=target,
             src=src,
@@ -477,8 +642,11 @@ def _build_runtime_objects(
             extra_cflags=extra,
             verbose=verbose,
         )
-        objs.append(obj)
-    return objs
+        return obj
+
+    # Each runtime TU is independent; pool.map keeps the link order and re-raises SystemExit.
+    with ThreadPoolExecutor(max_workers=min(len(runtime_sources), os.cpu_count() or 4)) as pool:
+        return list(pool.map(build, runtime_sources))
 
 
 def _link_elf(
@@ -497,16 +665,29 @@ def _link_elf(
         raise SystemExit(f"error: link failed: {out_elf}")
 
 
-def _parse_kernel_checksums(stdout_text: str, expected_kernels: list[str]) -> dict[str, str]:
-    expected = set(expected_kernels)
+def _disassemble_elf(*, llvm_objdump: Path, target: str, elf: Path, out: Path, mode: str, verbose: bool) -> None:
+    # The disassembly goes straight from llvm-objdump to the file; only stderr is captured.
+    with out.open("wb") as out_fh:
+        p = _run(
+            [str(llvm_objdump), "-d", f"--triple={target}", str(elf)],
+            verbose=verbose,
+            stdout=out_fh,
+            stderr=subprocess.PIPE,
+        )
+    if p.returncode != 0:
+        sys.stderr.buffer.write(p.stderr or b"")
+        raise SystemExit(f"error: llvm-objdump failed ({mode})")
+
+
+def _parse_kernel_checksums(blocks: Iterable[bytes], expected_kernels: list[str]) -> dict[str, str]:
+    """Collect the first checksum per expected kernel from line-aligned stdout blocks."""
+    expected = frozenset(expected_kernels)
     checksums: dict[str, str] = {}
-    for line in stdout_text.splitlines():
-        m = _RE_TSVC_ROW.match(line)
-        if not m:
-            continue
-        kernel, _timing, checksum = m.group(1), m.group(2), m.group(3)
-        if kernel in expected and kernel not in checksums:
-            checksums[kernel] = checksum
+    for block in blocks:
+        for kernel, _timing, checksum in _RE_TSVC_ROW.findall(block):
+            name = kernel.decode("ascii")
+            if name in expected and name not in checksums:
+                checksums[name] = checksum.decode("utf-8", errors="replace")
     return checksums
 
 
@@ -517,8 +698,14 @@ def _run_qemu(
     stdout_log: Path,
     stderr_log: Path,
     timeout_s: float,
+    expected_kernels: list[str],
     verbose: bool,
-) -> tuple[int, str]:
+) -> tuple[int, dict[str, str], bool]:
+    """Run the ELF, teeing stdout to its log while TSVC rows are parsed line by line.
+
+    Returns the exit code, the per-kernel checksums and whether the `Loop`/`Checksum`
+    header was seen.
+    """
     stdout_log.parent.mkdir(parents=True, exist_ok=True)
     stderr_log.parent.mkdir(parents=True, exist_ok=True)
     cmd = [
@@ -531,29 +718,61 @@ def _run_qemu(
         "-monitor",
         "none",
     ]
-    try:
-        p = _run(
-            cmd,
-            verbose=verbose,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            timeout=timeout_s,
-        )
-    except subprocess.TimeoutExpired as e:
-        stdout_log.write_bytes(e.stdout or b"")
-        stderr_log.write_bytes(e.stderr or b"")
-        raise SystemExit(f"error: QEMU timeout after {timeout_s:.1f}s ({elf.name})")
+    if verbose:
+        print("+", " ".join(shlex.quote(c) for c in cmd), file=sys.stderr)
 
-    stdout_log.write_bytes(p.stdout or b"")
-    stderr_log.write_bytes(p.stderr or b"")
-    text = (p.stdout or b"").decode("utf-8", errors="replace")
-    if p.returncode != 0:
+    header_words: set[bytes] = set()
+    expired = threading.Event()
+    with stdout_log.open("wb") as out_f, stderr_log.open("wb") as err_f:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_f) as proc:
+            assert proc.stdout is not None
+
+            def expire() -> None:
+                expired.set()
+                proc.kill()
+
+            def blocks() -> Iterator[bytes]:
+                # Hand the parser whole lines only; a partial trailing line waits for the next read.
+                pending = b""
+                while chunk := proc.stdout.read1(65536):
+                    out_f.write(chunk)
+                    data = pending + chunk
+                    cut = data.rfind(b"\n") + 1
+                    pending = data[cut:]
+                    if cut:
+                        header_words.update(w for w in (b"Loop", b"Checksum") if w in data[:cut])
+                        yield data[:cut]
+                if pending:
+                    header_words.update(w for w in (b"Loop", b"Checksum") if w in pending)
+                    yield pending
+
+            timer = threading.Timer(timeout_s, expire)
+            timer.start()
+            try:
+                checksums = _parse_kernel_checksums(blocks(), expected_kernels)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+
+    if expired.is_set():
+        raise SystemExit(f"error: QEMU timeout after {timeout_s:.1f}s ({elf.name})")
+    if returncode != 0:
         raise SystemExit(
-            f"error: QEMU failed (exit={p.returncode})\n"
+            f"error: QEMU failed (exit={returncode})\n"
             f"  stdout: {stdout_log}\n"
             f"  stderr: {stderr_log}"
         )
-    return p.returncode, text
+    return returncode, checksums, len(header_words) == 2
+
+
+@functools.lru_cache(maxsize=None)
+def _load_analyzer() -> ModuleType | None:
+    if str(TSVC_DIR) not in sys.path:
+        sys.path.insert(0, str(TSVC_DIR))
+    try:
+        return importlib.import_module(ANALYZE_SCRIPT.stem)
+    except ImportError:
+        return None
 
 
 def _run_analyzer(
@@ -569,11 +788,10 @@ def _run_analyzer(
     remarks_summary_out: Path,
     gap_plan_out: Path,
     strict_fail_under: int | None,
+    jobs: int,
     verbose: bool,
 ) -> int:
-    cmd = [
-        python,
-        str(ANALYZE_SCRIPT),
+    argv = [
         "--objdump",
         str(objdump),
         "--kernel-list",
@@ -590,17 +808,35 @@ def _run_analyzer(
         str(gap_plan_out),
         "--mode",
         mode,
+        "--jobs",
+        str(jobs),
     ]
     if remarks_jsonl is not None:
-        cmd += ["--remarks-jsonl", str(remarks_jsonl)]
+        argv += ["--remarks-jsonl", str(remarks_jsonl)]
     if strict_fail_under is not None:
-        cmd += ["--fail-under", str(strict_fail_under)]
-    p = _run(cmd, verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    if p.returncode != 0:
-        sys.stderr.buffer.write(p.stdout or b"")
-        sys.stderr.buffer.write(p.stderr or b"")
-        raise SystemExit(f"error: TSVC strict coverage analysis failed ({mode})")
-    payload = json.loads(json_out.read_text(encoding="utf-8"))
+        argv += ["--fail-under", str(strict_fail_under)]
+    # In-process only when the analyzer stays serial: its worker pool forks, and forking this
+    # multi-threaded process would hand the workers other threads' locks and pipe ends.
+    analyzer = _load_analyzer() if jobs == 1 else None
+    if analyzer is None:
+        p = _run([python, str(ANALYZE_SCRIPT), *argv], verbose=verbose, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if p.returncode != 0:
+            sys.stderr.buffer.write(p.stdout or b"")
+            sys.stderr.buffer.write(p.stderr or b"")
+            raise SystemExit(f"error: TSVC strict coverage analysis failed ({mode})")
+    else:
+        # Same process, same argv: skips an interpreter start-up and re-import per mode.
+        if verbose:
+            print("+", " ".join(shlex.quote(c) for c in [python, str(ANALYZE_SCRIPT), *argv]), file=sys.stderr)
+        try:
+            rc = analyzer.main(argv)
+        except SystemExit as e:
+            rc = e.code
+            if isinstance(rc, str):
+                print(rc, file=sys.stderr)
+        if rc:
+            raise SystemExit(f"error: TSVC strict coverage analysis failed ({mode})")
+    payload = _load_json(json_out)
     return int(payload.get("vectorized", 0))
 
 
@@ -636,7 +872,244 @@ def _run_checksum_compare(
         sys.stderr.buffer.write(p.stdout or b"")
         sys.stderr.buffer.write(p.stderr or b"")
         raise SystemExit("error: TSVC checksum comparison failed")
-    return json.loads(json_out.read_text(encoding="utf-8"))
+    return _load_json(json_out)
+
+
+def _build_mode_elf(
+    mode: str,
+    *,
+    clang: Path,
+    lld: Path,
+    target: str,
+    stage_dir: Path,
+    include_dirs: list[Path],
+    stage_header_digest: str,
+    runtime_objs: list[Path],
+    cache_dir: Path | None,
+    obj_dir: Path,
+    elf_path: Path,
+    remarks_jsonl: Path | None,
+    verbose: bool,
+) -> None:
+    obj_dir.mkdir(parents=True, exist_ok=True)
+    tsvc_obj = obj_dir / "tsvc.o"
+    common_obj = obj_dir / "common.o"
+    dummy_obj = obj_dir / "dummy.o"
+    # tsvc.c is never cached: its compile also writes the autovec remarks JSONL. common.c and
+    # dummy.c always build with the `off` flags, so every mode after the first reuses them.
+    staged_units = [
+        ("tsvc.c", tsvc_obj, _mode_compile_flags(mode, remarks_jsonl), None),
+        ("common.c", common_obj, _mode_compile_flags("off", None), cache_dir),
+        ("dummy.c", dummy_obj, _mode_compile_flags("off", None), cache_dir),
+    ]
+    with ThreadPoolExecutor(max_workers=len(staged_units)) as pool:
+        futures = [
+            pool.submit(
+                _compile_c_cached,
+                cache_dir=unit_cache,
+                header_digest=stage_header_digest,
+                clang=clang,
+                target=target,
+                src=stage_dir / name,
+                out_obj=obj,
+                include_dirs=include_dirs,
+                extra_cflags=cflags,
+                verbose=verbose,
+            )
+            for name, obj, cflags, unit_cache in staged_units
+        ]
+        for fut in futures:
+            fut.result()
+
+    _link_elf(
+        lld=lld,
+        out_elf=elf_path,
+        objs=[*runtime_objs, tsvc_obj, common_obj, dummy_obj],
+        verbose=verbose,
+    )
+
+
+def _publish_outputs(outputs: dict[Path, bytes]) -> None:
+    # Write-then-rename, so a reader polling the gate files never sees a partial document.
+    for path, data in outputs.items():
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+
+def _publish_alias(src: Path, dst: Path) -> None:
+    """Expose `src` under the mode-less name `dst`: a relative symlink, or a copy where links fail."""
+    if dst == src:
+        return
+    # Unlink first so neither path ever writes through to a file the previous run aliased.
+    dst.unlink(missing_ok=True)
+    try:
+        dst.symlink_to(os.path.relpath(src, dst.parent))
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _run_mode(
+    mode: str,
+    *,
+    clang: Path,
+    lld: Path,
+    llvm_objdump: Path,
+    qemu: Path | None,
+    run_qemu: bool,
+    qemu_slots: threading.BoundedSemaphore,
+    qemu_timeout: float,
+    target: str,
+    kernels: list[str],
+    kernel_list_path: Path,
+    stage_dir: Path,
+    include_dirs: list[Path],
+    stage_header_digest: str,
+    runtime_objs: list[Path],
+    cache_dir: Path | None,
+    build_dir: Path,
+    elf_dir: Path,
+    objdump_dir: Path,
+    qemu_dir: Path,
+    reports_dir: Path,
+    python: str,
+    strict_fail_under: int | None,
+    analyzer_jobs: int,
+    verbose: bool,
+) -> ModeArtifacts:
+    """Compile, link, disassemble, run and analyze one vector mode; every output path is mode-scoped."""
+    remarks_jsonl = None
+    if mode != "off":
+        remarks_jsonl = reports_dir / f"vectorization_remarks_raw.{mode}.jsonl"
+        if remarks_jsonl.exists():
+            remarks_jsonl.unlink()
+
+    elf_path = elf_dir / f"tsvc.{mode}.elf"
+    cached_elf = cached_remarks = None
+    if cache_dir is not None:
+        elf_key = _elf_cache_key(
+            clang=clang,
+            lld=lld,
+            target=target,
+            mode=mode,
+            stage_dir=stage_dir,
+            include_dirs=include_dirs,
+            header_digest=stage_header_digest,
+            link_objs=runtime_objs,
+        )
+        cached_elf = cache_dir / f"{elf_key}.elf"
+        cached_remarks = cache_dir / f"{elf_key}.remarks.jsonl"
+    if cached_elf is not None and cached_elf.exists():
+        # The remarks come from the tsvc.c compile, so a cached ELF brings its remarks along.
+        elf_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_elf, elf_path)
+        if remarks_jsonl is not None and cached_remarks.exists():
+            shutil.copyfile(cached_remarks, remarks_jsonl)
+    else:
+        _build_mode_elf(
+            mode,
+            clang=clang,
+            lld=lld,
+            target=target,
+            stage_dir=stage_dir,
+            include_dirs=include_dirs,
+            stage_header_digest=stage_header_digest,
+            runtime_objs=runtime_objs,
+            cache_dir=cache_dir,
+            obj_dir=build_dir / mode / "obj",
+            elf_path=elf_path,
+            remarks_jsonl=remarks_jsonl,
+            verbose=verbose,
+        )
+        if cached_elf is not None:
+            # Remarks first: a cached ELF must imply its remarks are already in place.
+            if remarks_jsonl is not None and remarks_jsonl.exists():
+                _store_in_cache(remarks_jsonl, cached_remarks)
+            _store_in_cache(elf_path, cached_elf)
+
+    objdump_path = objdump_dir / f"tsvc.{mode}.objdump.txt"
+    qemu_stdout = None
+    qemu_stderr = None
+    observed_kernels = None
+    # Disassembly only needs the ELF, so it runs alongside QEMU; the analyzer waits for both.
+    with ThreadPoolExecutor(max_workers=1) as objdump_pool:
+        objdump_future = objdump_pool.submit(
+            _disassemble_elf,
+            llvm_objdump=llvm_objdump,
+            target=target,
+            elf=elf_path,
+            out=objdump_path,
+            mode=mode,
+            verbose=verbose,
+        )
+        if run_qemu:
+            qemu_stdout = qemu_dir / f"tsvc.{mode}.stdout.txt"
+            qemu_stderr = qemu_dir / f"tsvc.{mode}.stderr.txt"
+            assert qemu is not None
+            with qemu_slots:
+                _exit_code, checksum_by_kernel, has_header = _run_qemu(
+                    qemu=qemu,
+                    elf=elf_path,
+                    stdout_log=qemu_stdout,
+                    stderr_log=qemu_stderr,
+                    timeout_s=qemu_timeout,
+                    expected_kernels=kernels,
+                    verbose=verbose,
+                )
+            if not has_header:
+                raise SystemExit(
+                    f"error: TSVC output missing header ({mode})\n"
+                    f"  stdout: {qemu_stdout}\n"
+                    f"  stderr: {qemu_stderr}"
+                )
+            observed_kernels = len(checksum_by_kernel)
+            missing = [k for k in kernels if k not in checksum_by_kernel]
+            if missing:
+                preview = ", ".join(missing[:8])
+                raise SystemExit(
+                    f"error: TSVC missing kernels on QEMU ({mode}): {len(missing)}\n"
+                    f"  missing sample: {preview}\n"
+                    f"  stdout: {qemu_stdout}\n"
+                    f"  stderr: {qemu_stderr}"
+                )
+        objdump_future.result()
+
+    coverage_md = reports_dir / f"vectorization_coverage.{mode}.md"
+    coverage_json = reports_dir / f"vectorization_coverage.{mode}.json"
+    remarks_summary_json = reports_dir / f"vectorization_remarks.{mode}.json"
+    gap_plan_json = reports_dir / f"vectorization_gap_plan.{mode}.json"
+    kernel_out_dir = objdump_dir / "kernels" / mode
+    vectorized = _run_analyzer(
+        python=python,
+        mode=mode,
+        objdump=objdump_path,
+        kernel_list=kernel_list_path,
+        kernel_out_dir=kernel_out_dir,
+        report=coverage_md,
+        json_out=coverage_json,
+        remarks_jsonl=remarks_jsonl,
+        remarks_summary_out=remarks_summary_json,
+        gap_plan_out=gap_plan_json,
+        strict_fail_under=strict_fail_under if mode != "off" else None,
+        jobs=analyzer_jobs,
+        verbose=verbose,
+    )
+
+    return ModeArtifacts(
+        mode=mode,
+        elf=elf_path,
+        objdump=objdump_path,
+        qemu_stdout=qemu_stdout,
+        qemu_stderr=qemu_stderr,
+        observed_kernels=observed_kernels,
+        remarks_jsonl=remarks_jsonl,
+        coverage_md=coverage_md,
+        coverage_json=coverage_json,
+        remarks_summary_json=remarks_summary_json,
+        gap_plan_json=gap_plan_json,
+        vectorized_kernels=vectorized,
+        total_kernels=len(kernels),
+    )
 
 
 def main(argv: list[str]) -> int:
@@ -688,6 +1161,7 @@ def main(argv: list[str]) -> int:
         help="Fail when checksum comparison finds missing kernels or mismatches.",
     )
     ap.add_argument("--out-dir", default=str(GENERATED_DIR), help="Generated artifacts root")
+    ap.add_argument("--no-cache", action="store_true", help="Rebuild every object instead of reusing build/tsvc/_cache")
     ap.add_argument("--verbose", "-v", action="store_true")
     args = ap.parse_args(argv)
 
@@ -736,8 +1210,7 @@ def main(argv: list[str]) -> int:
         raise SystemExit("error: --compare-baseline-log requires QEMU execution")
 
     tsvc_src = _resolve_tsvc_src(args.tsvc_src)
-    required = ["common.h", "tsvc.c", "common.c", "dummy.c", "array_defs.h"]
-    for name in required:
+    for name in _TSVC_SOURCE_FILES:
         if not (tsvc_src / name).exists():
             raise SystemExit(f"error: malformed TSVC source tree, missing: {tsvc_src / name}")
 
@@ -761,12 +1234,16 @@ def main(argv: list[str]) -> int:
         source_policy=args.source_policy,
     )
     kernel_list_path = reports_dir / "kernel_list.txt"
-    kernel_list_path.write_text("\n".join(kernels) + "\n", encoding="utf-8")
+    kernel_list_path.write_bytes(("\n".join(kernels) + "\n").encode("utf-8"))
 
+    cache_dir = None if args.no_cache else build_dir / "_cache"
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
     runtime_objs = _build_runtime_objects(
         clang=clang,
         target=args.target,
         out_dir=build_dir,
+        cache_dir=cache_dir,
         verbose=args.verbose,
     )
 
@@ -776,163 +1253,62 @@ def main(argv: list[str]) -> int:
         modes = [args.vector_mode]
 
     python = sys.executable or "python3"
-    results: dict[str, ModeArtifacts] = {}
     include_dirs = [COMPAT_INCLUDE, FREESTANDING_INCLUDE, stage_dir]
-    for mode in modes:
-        mode_obj_dir = build_dir / mode / "obj"
-        mode_obj_dir.mkdir(parents=True, exist_ok=True)
-        remarks_jsonl = None
-        if mode != "off":
-            remarks_jsonl = reports_dir / f"vectorization_remarks_raw.{mode}.jsonl"
-            if remarks_jsonl.exists():
-                remarks_jsonl.unlink()
-
-        tsvc_obj = mode_obj_dir / "tsvc.o"
-        common_obj = mode_obj_dir / "common.o"
-        dummy_obj = mode_obj_dir / "dummy.o"
-        _compile_c(
-            clang=clang,
-            target=args.target,
-            src=stage_dir / "tsvc.c",
-            out_obj=tsvc_obj,
-            include_dirs=include_dirs,
-            extra_cflags=_mode_compile_flags(mode, remarks_jsonl),
-            verbose=args.verbose,
-        )
-        _compile_c(
-            clang=clang,
-            target=args.target,
-            src=stage_dir / "common.c",
-            out_obj=common_obj,
-            include_dirs=include_dirs,
-            extra_cflags=_mode_compile_flags("off", None),
-            verbose=args.verbose,
-        )
-        _compile_c(
-            clang=clang,
-            target=args.target,
-            src=stage_dir / "dummy.c",
-            out_obj=dummy_obj,
-            include_dirs=include_dirs,
-            extra_cflags=_mode_compile_flags("off", None),
-            verbose=args.verbose,
-        )
-
-        elf_path = elf_dir / f"tsvc.{mode}.elf"
-        _link_elf(
-            lld=lld,
-            out_elf=elf_path,
-            objs=[*runtime_objs, tsvc_obj, common_obj, dummy_obj],
-            verbose=args.verbose,
-        )
-
-        objdump_path = objdump_dir / f"tsvc.{mode}.objdump.txt"
-        p = _run(
-            [str(llvm_objdump), "-d", f"--triple={args.target}", str(elf_path)],
-            verbose=args.verbose,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-        if p.returncode != 0:
-            sys.stderr.buffer.write(p.stdout or b"")
-            sys.stderr.buffer.write(p.stderr or b"")
-            raise SystemExit(f"error: llvm-objdump failed ({mode})")
-        objdump_path.write_bytes(p.stdout or b"")
-
-        qemu_stdout = None
-        qemu_stderr = None
-        observed_kernels = None
-        checksum_by_kernel: dict[str, str] | None = None
-        if not args.no_run_qemu:
-            qemu_stdout = qemu_dir / f"tsvc.{mode}.stdout.txt"
-            qemu_stderr = qemu_dir / f"tsvc.{mode}.stderr.txt"
-            _exit_code, out_text = _run_qemu(
+    stage_header_digest = _header_digest(include_dirs) if cache_dir is not None else ""
+    # Modes share only the stage dir and runtime objects, so their pipelines can overlap. Each
+    # worker mostly waits on clang/QEMU; the semaphore keeps concurrent QEMU runs in check.
+    qemu_slots = threading.BoundedSemaphore(max(1, (os.cpu_count() or 4) // 2))
+    # Split the analyzer's scan workers across the concurrent modes instead of giving each all CPUs.
+    analyzer_jobs = max(1, (os.cpu_count() or 1) // len(modes))
+    with ThreadPoolExecutor(max_workers=len(modes)) as ex:
+        futures = {
+            mode: ex.submit(
+                _run_mode,
+                mode,
+                clang=clang,
+                lld=lld,
+                llvm_objdump=llvm_objdump,
                 qemu=qemu,
-                elf=elf_path,
-                stdout_log=qemu_stdout,
-                stderr_log=qemu_stderr,
-                timeout_s=args.qemu_timeout,
+                run_qemu=not args.no_run_qemu,
+                qemu_slots=qemu_slots,
+                qemu_timeout=args.qemu_timeout,
+                target=args.target,
+                kernels=kernels,
+                kernel_list_path=kernel_list_path,
+                stage_dir=stage_dir,
+                include_dirs=include_dirs,
+                stage_header_digest=stage_header_digest,
+                runtime_objs=runtime_objs,
+                cache_dir=cache_dir,
+                build_dir=build_dir,
+                elf_dir=elf_dir,
+                objdump_dir=objdump_dir,
+                qemu_dir=qemu_dir,
+                reports_dir=reports_dir,
+                python=python,
+                strict_fail_under=args.strict_fail_under,
+                analyzer_jobs=analyzer_jobs,
                 verbose=args.verbose,
             )
-            if "Loop" not in out_text or "Checksum" not in out_text:
-                raise SystemExit(
-                    f"error: TSVC output missing header ({mode})\n"
-                    f"  stdout: {qemu_stdout}\n"
-                    f"  stderr: {qemu_stderr}"
-                )
-            checksum_by_kernel = _parse_kernel_checksums(out_text, kernels)
-            observed_kernels = len(checksum_by_kernel)
-            missing = [k for k in kernels if k not in checksum_by_kernel]
-            if missing:
-                preview = ", ".join(missing[:8])
-                raise SystemExit(
-                    f"error: TSVC missing kernels on QEMU ({mode}): {len(missing)}\n"
-                    f"  missing sample: {preview}\n"
-                    f"  stdout: {qemu_stdout}\n"
-                    f"  stderr: {qemu_stderr}"
-                )
-
-        coverage_md = reports_dir / f"vectorization_coverage.{mode}.md"
-        coverage_json = reports_dir / f"vectorization_coverage.{mode}.json"
-        remarks_summary_json = reports_dir / f"vectorization_remarks.{mode}.json"
-        gap_plan_json = reports_dir / f"vectorization_gap_plan.{mode}.json"
-        kernel_out_dir = objdump_dir / "kernels" / mode
-        vectorized = _run_analyzer(
-            python=python,
-            mode=mode,
-            objdump=objdump_path,
-            kernel_list=kernel_list_path,
-            kernel_out_dir=kernel_out_dir,
-            report=coverage_md,
-            json_out=coverage_json,
-            remarks_jsonl=remarks_jsonl,
-            remarks_summary_out=remarks_summary_json,
-            gap_plan_out=gap_plan_json,
-            strict_fail_under=args.strict_fail_under if mode != "off" else None,
-            verbose=args.verbose,
-        )
-
-        results[mode] = ModeArtifacts(
-            mode=mode,
-            elf=elf_path,
-            objdump=objdump_path,
-            qemu_stdout=qemu_stdout,
-            qemu_stderr=qemu_stderr,
-            observed_kernels=observed_kernels,
-            remarks_jsonl=remarks_jsonl,
-            coverage_md=coverage_md,
-            coverage_json=coverage_json,
-            remarks_summary_json=remarks_summary_json,
-            gap_plan_json=gap_plan_json,
-            vectorized_kernels=vectorized,
-            total_kernels=len(kernels),
-            checksums=checksum_by_kernel,
-        )
+            for mode in modes
+        }
+        results: dict[str, ModeArtifacts] = {mode: fut.result() for mode, fut in futures.items()}
 
     selected_mode = "auto" if "auto" in results else modes[-1]
     selected = results[selected_mode]
 
-    (reports_dir / "vectorization_coverage.md").write_text(
-        selected.coverage_md.read_text(encoding="utf-8"),
-        encoding="utf-8",
-    )
-    (reports_dir / "vectorization_coverage.json").write_text(
-        selected.coverage_json.read_text(encoding="utf-8"),
-        encoding="utf-8",
-    )
-    (reports_dir / "vectorization_remarks.json").write_text(
-        selected.remarks_summary_json.read_text(encoding="utf-8"),
-        encoding="utf-8",
-    )
-    (reports_dir / "vectorization_gap_plan.json").write_text(
-        selected.gap_plan_json.read_text(encoding="utf-8"),
-        encoding="utf-8",
-    )
+    coverage_md_out = reports_dir / "vectorization_coverage.md"
+    coverage_json_out = reports_dir / "vectorization_coverage.json"
+    remarks_json_out = reports_dir / "vectorization_remarks.json"
+    gap_plan_json_out = reports_dir / "vectorization_gap_plan.json"
+    _publish_alias(selected.coverage_md, coverage_md_out)
+    _publish_alias(selected.coverage_json, coverage_json_out)
+    _publish_alias(selected.remarks_summary_json, remarks_json_out)
+    _publish_alias(selected.gap_plan_json, gap_plan_json_out)
     if selected.remarks_jsonl and selected.remarks_jsonl.exists():
-        (reports_dir / "vectorization_remarks_raw.jsonl").write_text(
-            selected.remarks_jsonl.read_text(encoding="utf-8", errors="replace"),
-            encoding="utf-8",
-        )
+        _publish_alias(selected.remarks_jsonl, reports_dir / "vectorization_remarks_raw.jsonl")
+    # Only the coverage JSON is read back, as the gate embeds it.
+    coverage_bytes = selected.coverage_json.read_bytes()
 
     checksum_payload: dict[str, object] | None = None
     checksum_report_json: Path | None = None
@@ -958,10 +1334,15 @@ def main(argv: list[str]) -> int:
             verbose=args.verbose,
         )
 
+    is_canonical = (
+        args.iterations == _CANONICAL_ITERATIONS
+        and args.len_1d == _CANONICAL_LEN_1D
+        and args.len_2d == _CANONICAL_LEN_2D
+    )
     gate_payload = {
-        "generated_at_utc": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "generated_at_utc": datetime.now(timezone.utc).isoformat(),
         "tool": "workloads/tsvc/run_tsvc.py",
-        "command": " ".join([shlex.quote(sys.executable or "python3"), "workloads/tsvc/run_tsvc.py", *[shlex.quote(a) for a in argv]]),
+        "command": shlex.join([python, "workloads/tsvc/run_tsvc.py", *argv]),
         "mode_selected": selected_mode,
         "vector_modes_run": modes,
         "source_policy": args.source_policy,
@@ -970,11 +1351,7 @@ def main(argv: list[str]) -> int:
             "iterations": args.iterations,
             "len_1d": args.len_1d,
             "len_2d": args.len_2d,
-            "is_canonical": (
-                args.iterations == _CANONICAL_ITERATIONS
-                and args.len_1d == _CANONICAL_LEN_1D
-                and args.len_2d == _CANONICAL_LEN_2D
-            ),
+            "is_canonical": is_canonical,
         },
         "lane_policy": args.lane_policy,
         "resolved_lanes": {
@@ -983,30 +1360,34 @@ def main(argv: list[str]) -> int:
             "qemu": _classify_lane(qemu),
         },
         "executables": {
-            "clang": str(clang),
-            "lld": str(lld),
-            "llvm_objdump": str(llvm_objdump),
-            "qemu": str(qemu) if qemu else None,
+            "clang": os.fspath(clang),
+            "lld": os.fspath(lld),
+            "llvm_objdump": os.fspath(llvm_objdump),
+            "qemu": os.fspath(qemu) if qemu else None,
         },
         "sha_manifest": _build_sha_manifest(),
         "target": args.target,
         "kernel_count": len(kernels),
         "selected_artifacts": {
-            "elf": str(selected.elf),
-            "objdump": str(selected.objdump),
-            "qemu_stdout": str(selected.qemu_stdout) if selected.qemu_stdout else None,
-            "qemu_stderr": str(selected.qemu_stderr) if selected.qemu_stderr else None,
-            "coverage_json": str(selected.coverage_json),
-            "remarks_json": str(selected.remarks_summary_json),
-            "gap_plan_json": str(selected.gap_plan_json),
+            "elf": os.fspath(selected.elf),
+            "objdump": os.fspath(selected.objdump),
+            "qemu_stdout": os.fspath(selected.qemu_stdout) if selected.qemu_stdout else None,
+            "qemu_stderr": os.fspath(selected.qemu_stderr) if selected.qemu_stderr else None,
+            "coverage_json": os.fspath(selected.coverage_json),
+            "remarks_json": os.fspath(selected.remarks_summary_json),
+            "gap_plan_json": os.fspath(selected.gap_plan_json),
         },
-        "coverage": json.loads(selected.coverage_json.read_text(encoding="utf-8")),
+        "coverage": _GATE_COVERAGE_SLOT,
         "checksum_compare": checksum_payload,
     }
     gate_json_mode = reports_dir / f"gate_result.{selected_mode}.json"
     gate_json_latest = reports_dir / "gate_result.json"
-    gate_json_mode.write_text(json.dumps(gate_payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-    gate_json_latest.write_text(gate_json_mode.read_text(encoding="utf-8"), encoding="utf-8")
+    # The analyzer already wrote the coverage document with the same indent/sort settings, so it
+    # is spliced in verbatim (one level deeper) rather than parsed and re-serialized.
+    gate_bytes = _dump_json(gate_payload).replace(
+        b'"' + _GATE_COVERAGE_SLOT.encode() + b'"', coverage_bytes.strip().replace(b"\n", b"\n  "), 1
+    )
+    final_outputs = {gate_json_mode: gate_bytes, gate_json_latest: gate_bytes}
 
     summary = [
         "# TSVC auto-vectorization report",
@@ -1014,30 +1395,27 @@ def main(argv: list[str]) -> int:
         f"- Source: `{tsvc_src}`",
         f"- Source policy: `{args.source_policy}`",
         f"- Profile: `iterations={args.iterations}`, `LEN_1D={args.len_1d}`, `LEN_2D={args.len_2d}`",
-        f"- Canonical profile: `{'yes' if (args.iterations == _CANONICAL_ITERATIONS and args.len_1d == _CANONICAL_LEN_1D and args.len_2d == _CANONICAL_LEN_2D) else 'no'}`",
+        f"- Canonical profile: `{'yes' if is_canonical else 'no'}`",
         f"- Lane policy: `{args.lane_policy}`",
         f"- Modes run: `{', '.join(modes)}`",
         f"- QEMU executed: `{'no' if args.no_run_qemu else 'yes'}`",
         "",
         "## Mode artifacts",
     ]
-    for mode in modes:
-        item = results[mode]
-        qemu_status = "skipped"
-        if not args.no_run_qemu:
-            qemu_status = f"{item.observed_kernels}/{item.total_kernels} kernels"
-        summary.append(
-            f"- `{mode}`: strict vectorized `{item.vectorized_kernels}/{item.total_kernels}`, "
-            f"QEMU `{qemu_status}`, objdump `{item.objdump}`"
-        )
+    summary.extend(
+        f"- `{item.mode}`: strict vectorized `{item.vectorized_kernels}/{item.total_kernels}`, "
+        f"QEMU `{'skipped' if args.no_run_qemu else f'{item.observed_kernels}/{item.total_kernels} kernels'}`, "
+        f"objdump `{item.objdump}`"
+        for item in map(results.__getitem__, modes)
+    )
     summary.extend(
         [
             "",
             "## Selected mode outputs",
-            f"- Coverage: `{reports_dir / 'vectorization_coverage.md'}`",
-            f"- Coverage JSON: `{reports_dir / 'vectorization_coverage.json'}`",
-            f"- Remarks JSON: `{reports_dir / 'vectorization_remarks.json'}`",
-            f"- Gap plan JSON: `{reports_dir / 'vectorization_gap_plan.json'}`",
+            f"- Coverage: `{coverage_md_out}`",
+            f"- Coverage JSON: `{coverage_json_out}`",
+            f"- Remarks JSON: `{remarks_json_out}`",
+            f"- Gap plan JSON: `{gap_plan_json_out}`",
             f"- Gate JSON: `{gate_json_latest}`",
             f"- Kernel objdumps: `{objdump_dir / 'kernels' / selected_mode}`",
         ]
@@ -1049,7 +1427,7 @@ def main(argv: list[str]) -> int:
                 f"- QEMU stderr: `{selected.qemu_stderr}`",
             ]
         )
-    if checksum_payload is not None and checksum_report_json and checksum_report_md:
+    if checksum_payload is not None:
         summary.extend(
             [
                 f"- Checksum compare JSON: `{checksum_report_json}`",
@@ -1057,7 +1435,8 @@ def main(argv: list[str]) -> int:
                 f"- Checksum mismatches: `{int(checksum_payload.get('checksum_mismatch_count', 0))}`",
             ]
         )
-    (out_root / "tsvc_report.md").write_text("\n".join(summary) + "\n", encoding="utf-8")
+    final_outputs[out_root / "tsvc_report.md"] = ("\n".join(summary) + "\n").encode("utf-8")
+    _publish_outputs(final_outputs)
 
     print(
         f"ok: TSVC {selected_mode} artifacts generated under {out_root}",